@@ -6,11 +6,10 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 
 from config import settings
 from utils.logger import logger
+from models.llm_client import get_llm_client
 from models.prompts import CLINICAL_CRITIC_SYSTEM_PROMPT, get_critic_user_prompt
 from .base_agent import BaseAgent, AgentResponse
 
@@ -35,21 +34,12 @@ class ClinicalCriticAgent(BaseAgent):
             max_tokens=1500
         )
         
-        # Initialize LLM client
-        if settings.primary_llm_provider == "openai":
-            self.llm = ChatOpenAI(
-                model=settings.openai_model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                api_key=settings.openai_api_key
-            )
-        else:
-            self.llm = ChatAnthropic(
-                model=settings.anthropic_model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                api_key=settings.anthropic_api_key
-            )
+        # Initialize LLM client (identical prompts are answered from cache)
+        self.llm = get_llm_client(
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            cache_namespace=self.name
+        )
         
         self.logger.info("Clinical Critic initialized")
     
@@ -73,57 +63,86 @@ class ClinicalCriticAgent(BaseAgent):
         })
         
         try:
-            # Create user prompt using centralized function
-            user_prompt = get_critic_user_prompt(
-                user_intent=state.user_intent,
-                draft=state.current_draft
-            )
-            
-            # Perform quality assessment
-            messages = [
-                SystemMessage(content=self.get_system_prompt()),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = self.llm.invoke(messages)
-            quality_assessment = response.content
-            
-            # Parse assessment
-            parsed_assessment = self._parse_assessment(quality_assessment)
-            
-            # Extract suggestions
-            suggestions = self._extract_suggestions(parsed_assessment)
+            response = self.llm.invoke(self._build_messages(state))
+            return self._build_agent_response(state, response.content)
             
-            # Determine if revisions needed
-            flags = self._determine_flags(parsed_assessment)
-            
-            # Create response
-            agent_response = self._create_response(
-                content=quality_assessment,
-                reasoning=f"Clinical quality review completed. Overall score: {parsed_assessment.get('overall_score', 'N/A')}/10",
-                confidence=parsed_assessment.get("confidence", 0.85),
-                suggestions=suggestions,
-                flags=flags,
-                metadata={
-                    "overall_score": parsed_assessment.get("overall_score", 0),
-                    "empathy_score": parsed_assessment.get("empathy_score", 0),
-                    "recommendation": parsed_assessment.get("recommendation", "REVIEW"),
-                    "individual_scores": parsed_assessment.get("individual_scores", {}),
-                    "iteration": state.iteration_count
-                }
-            )
-            
-            self._log_action("Clinical review completed", {
-                "overall_score": parsed_assessment.get("overall_score"),
-                "recommendation": parsed_assessment.get("recommendation")
-            })
+        except Exception as e:
+            self.logger.error(f"Error in clinical review: {str(e)}")
+            raise
+    
+    async def aprocess(self, state: Any) -> AgentResponse:
+        """
+        Async variant of ``process`` (the LLM call doesn't block the event loop).
+        
+        Args:
+            state: Current protocol state
             
-            return agent_response
+        Returns:
+            AgentResponse with quality assessment
+        """
+        self._log_action("Starting clinical quality review", {
+            "draft_length": len(state.current_draft) if state.current_draft else 0,
+            "iteration": state.iteration_count
+        })
+        
+        try:
+            response = await self.llm.ainvoke(self._build_messages(state))
+            return self._build_agent_response(state, response.content)
             
         except Exception as e:
             self.logger.error(f"Error in clinical review: {str(e)}")
             raise
     
+    def _build_messages(self, state: Any) -> list:
+        """Build the LLM messages for reviewing the current draft."""
+        # Create user prompt using centralized function
+        user_prompt = get_critic_user_prompt(
+            user_intent=state.user_intent,
+            draft=state.current_draft
+        )
+        
+        # Perform quality assessment
+        messages = [
+            SystemMessage(content=self.get_system_prompt()),
+            HumanMessage(content=user_prompt)
+        ]
+        
+        return messages
+    
+    def _build_agent_response(self, state: Any, quality_assessment: str) -> AgentResponse:
+        """Parse the LLM assessment into an AgentResponse."""
+        # Parse assessment
+        parsed_assessment = self._parse_assessment(quality_assessment)
+        
+        # Extract suggestions
+        suggestions = self._extract_suggestions(parsed_assessment)
+        
+        # Determine if revisions needed
+        flags = self._determine_flags(parsed_assessment)
+        
+        # Create response
+        agent_response = self._create_response(
+            content=quality_assessment,
+            reasoning=f"Clinical quality review completed. Overall score: {parsed_assessment.get('overall_score', 'N/A')}/10",
+            confidence=parsed_assessment.get("confidence", 0.85),
+            suggestions=suggestions,
+            flags=flags,
+            metadata={
+                "overall_score": parsed_assessment.get("overall_score", 0),
+                "empathy_score": parsed_assessment.get("empathy_score", 0),
+                "recommendation": parsed_assessment.get("recommendation", "REVIEW"),
+                "individual_scores": parsed_assessment.get("individual_scores", {}),
+                "iteration": state.iteration_count
+            }
+        )
+        
+        self._log_action("Clinical review completed", {
+            "overall_score": parsed_assessment.get("overall_score"),
+            "recommendation": parsed_assessment.get("recommendation")
+        })
+        
+        return agent_response
+    
     def _parse_assessment(self, assessment: str) -> Dict[str, Any]:
         """Parse the quality assessment into structured format."""
         import re
@@ -3,14 +3,14 @@ CBT Drafter Agent - Primary content generator for CBT protocols.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 
 from config import settings
 from utils.logger import logger
+from utils.helpers import calculate_word_count
+from models.llm_client import get_llm_client
 from models.prompts import DRAFTER_SYSTEM_PROMPT, get_drafter_user_prompt
 from .base_agent import BaseAgent, AgentResponse
 
@@ -35,21 +35,12 @@ class CBTDrafterAgent(BaseAgent):
             max_tokens=3000
         )
         
-        # Initialize LLM client
-        if settings.primary_llm_provider == "openai":
-            self.llm = ChatOpenAI(
-                model=settings.openai_model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                api_key=settings.openai_api_key
-            )
-        else:
-            self.llm = ChatAnthropic(
-                model=settings.anthropic_model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                api_key=settings.anthropic_api_key
-            )
+        # Initialize LLM client (identical prompts are answered from cache)
+        self.llm = get_llm_client(
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            cache_namespace=self.name
+        )
         
         self.logger.info(f"CBT Drafter initialized with {settings.primary_llm_provider}")
     
@@ -92,9 +83,10 @@ class CBTDrafterAgent(BaseAgent):
             
             response = self.llm.invoke(messages)
             draft_content = response.content
+            word_count = calculate_word_count(draft_content)
             
             # Evaluate quality of generated content
-            confidence = self._evaluate_draft_quality(draft_content)
+            confidence = self._evaluate_draft_quality(draft_content, word_count)
             
             # Create structured response
             agent_response = self._create_response(
@@ -103,7 +95,7 @@ class CBTDrafterAgent(BaseAgent):
                 confidence=confidence,
                 suggestions=[],
                 metadata={
-                    "word_count": len(draft_content.split()),
+                    "word_count": word_count,
                     "has_structure": self._check_structure(draft_content),
                     "iteration": state.iteration_count + 1
                 }
@@ -111,7 +103,7 @@ class CBTDrafterAgent(BaseAgent):
             
             self._log_action("Draft generation completed", {
                 "confidence": confidence,
-                "word_count": len(draft_content.split())
+                "word_count": word_count
             })
             
             return agent_response
@@ -120,12 +112,13 @@ class CBTDrafterAgent(BaseAgent):
             self.logger.error(f"Error in draft generation: {str(e)}")
             raise
     
-    def _evaluate_draft_quality(self, draft: str) -> float:
+    def _evaluate_draft_quality(self, draft: str, word_count: Optional[int] = None) -> float:
         """
         Evaluate the quality of generated draft.
         
         Args:
             draft: Generated draft content
+            word_count: Word count of the draft (counted here if omitted)
             
         Returns:
             Confidence score (0.0-1.0)
@@ -146,7 +139,8 @@ class CBTDrafterAgent(BaseAgent):
         score += (sections_present / len(required_sections)) * 0.5
         
         # Check length (should be substantial)
-        word_count = len(draft.split())
+        if word_count is None:
+            word_count = calculate_word_count(draft)
         if word_count >= 400:
             score += 0.3
         elif word_count >= 200:
@@ -66,8 +66,8 @@ class SupervisorAgent(BaseAgent):
         self._log_action("Evaluating workflow state", {
             "iteration": state.iteration_count,
             "has_draft": bool(state.current_draft),
-            "safety_flags": len(state.scratchpad.get("safety_flags", [])),
-            "critic_flags": len(state.scratchpad.get("critic_feedback", []))
+            "safety_flags": len(state.safety_flags),
+            "critic_flags": len(state.critic_feedbacks)
         })
         
         # Check max iterations
@@ -101,72 +101,66 @@ class SupervisorAgent(BaseAgent):
             return "run_critic"
         
         # Check for blocking safety issues
-        safety_flags = state.scratchpad.get("safety_flags", [])
-        if safety_flags:
-            latest_flags = [f for f in safety_flags if isinstance(f, dict)]
-            if latest_flags:
-                latest_flag = latest_flags[-1]
-                # Only revise on HIGH severity or UNSAFE rating
-                flag_str = str(latest_flag)
-                if "UNSAFE" in flag_str or "HIGH" in flag_str:
-                    self._log_action("Critical safety issues - requesting revision")
-                    self._record_decision(state, "run_drafter", "Address critical safety concerns")
-                    return "run_drafter"
+        if state.safety_flags:
+            latest_flag = state.safety_flags[-1]
+            # Only revise on HIGH severity or UNSAFE rating
+            flag_str = f"{latest_flag.issue} {latest_flag.recommendation}"
+            if "UNSAFE" in flag_str or "HIGH" in flag_str:
+                self._log_action("Critical safety issues - requesting revision")
+                self._record_decision(state, "run_drafter", "Address critical safety concerns")
+                return "run_drafter"
         
         # Check for quality issues requiring revision - IMPROVED LOGIC
-        critic_feedback = state.scratchpad.get("critic_feedback", [])
-        if critic_feedback:
-            latest_feedback = [f for f in critic_feedback if isinstance(f, dict)]
-            if latest_feedback:
-                latest = latest_feedback[-1]
-                recommendation = latest.get("recommendation", "")
-                overall_score = latest.get("overall_score", 0)
-                
-                # Log the quality assessment
-                self._log_action("Quality assessment", {
-                    "score": overall_score,
-                    "threshold": self.quality_threshold,
-                    "recommendation": recommendation
-                })
-                
-                # Only request revision for MAJOR issues
-                if "MAJOR" in recommendation:
-                    self._log_action("Major quality issues - requesting revision")
-                    self._record_decision(state, "run_drafter", "Address major quality concerns")
-                    return "run_drafter"
-                
-                # For minor issues, only revise if:
-                # 1. Score is below threshold (7.5)
-                # 2. We have iterations left to improve
-                # 3. We haven't already done too many revisions (prevent loops)
-                elif overall_score < self.quality_threshold:
-                    if state.iteration_count < self.max_iterations - 1:
-                        self._log_action("Score below threshold - requesting revision", {
-                            "score": overall_score,
-                            "threshold": self.quality_threshold
-                        })
-                        self._record_decision(
-                            state, 
-                            "run_drafter", 
-                            f"Improve quality score from {overall_score} to {self.quality_threshold}+"
-                        )
-                        return "run_drafter"
-                    else:
-                        # No iterations left, accept as-is
-                        self._log_action("Score below threshold but no iterations left - halting")
-                        self._record_decision(
-                            state,
-                            "halt_for_human",
-                            f"Quality score {overall_score} below threshold but max iterations reached"
-                        )
-                        return "halt_for_human"
-                
-                # Score meets threshold - ready for human review
-                else:
-                    self._log_action("Quality score meets threshold - ready for review", {
+        if state.critic_feedbacks:
+            latest = state.critic_feedbacks[-1]
+            recommendation = latest.recommendation
+            overall_score = latest.overall_score
+            
+            # Log the quality assessment
+            self._log_action("Quality assessment", {
+                "score": overall_score,
+                "threshold": self.quality_threshold,
+                "recommendation": recommendation
+            })
+            
+            # Only request revision for MAJOR issues
+            if "MAJOR" in recommendation:
+                self._log_action("Major quality issues - requesting revision")
+                self._record_decision(state, "run_drafter", "Address major quality concerns")
+                return "run_drafter"
+            
+            # For minor issues, only revise if:
+            # 1. Score is below threshold (7.5)
+            # 2. We have iterations left to improve
+            # 3. We haven't already done too many revisions (prevent loops)
+            elif overall_score < self.quality_threshold:
+                if state.iteration_count < self.max_iterations - 1:
+                    self._log_action("Score below threshold - requesting revision", {
                         "score": overall_score,
                         "threshold": self.quality_threshold
                     })
+                    self._record_decision(
+                        state, 
+                        "run_drafter", 
+                        f"Improve quality score from {overall_score} to {self.quality_threshold}+"
+                    )
+                    return "run_drafter"
+                else:
+                    # No iterations left, accept as-is
+                    self._log_action("Score below threshold but no iterations left - halting")
+                    self._record_decision(
+                        state,
+                        "halt_for_human",
+                        f"Quality score {overall_score} below threshold but max iterations reached"
+                    )
+                    return "halt_for_human"
+            
+            # Score meets threshold - ready for human review
+            else:
+                self._log_action("Quality score meets threshold - ready for review", {
+                    "score": overall_score,
+                    "threshold": self.quality_threshold
+                })
         
         # =================================================================================
         # ✅ CRITICAL FIX: BYPASS HUMAN REVIEW FOR MCP
@@ -214,13 +208,11 @@ class SupervisorAgent(BaseAgent):
         Returns:
             True if quality check is recent (same iteration)
         """
-        critic_feedback = state.scratchpad.get("critic_feedback", [])
-        if not critic_feedback:
+        if not state.critic_feedbacks:
             return False
         
         # Check if latest review is for current iteration
-        latest_review = critic_feedback[-1] if isinstance(critic_feedback[-1], dict) else {}
-        return latest_review.get("iteration") == state.iteration_count
+        return state.critic_feedbacks[-1].iteration == state.iteration_count
     
     def _record_decision(self, state: Any, action: str, reason: str):
         """
@@ -233,9 +225,6 @@ class SupervisorAgent(BaseAgent):
             action: Decision action taken
             reason: Reasoning for the decision
         """
-        if "supervisor_decisions" not in state.scratchpad:
-            state.scratchpad["supervisor_decisions"] = []
-        
         decision_record = {
             "timestamp": datetime.now().isoformat(),  # ISO format for JSON serialization
             "iteration": state.iteration_count,
@@ -243,7 +232,7 @@ class SupervisorAgent(BaseAgent):
             "reason": reason
         }
         
-        state.scratchpad["supervisor_decisions"].append(decision_record)
+        state.scratchpad.setdefault("supervisor_decisions", []).append(decision_record)
         
         # Also log for monitoring
         self.logger.debug(f"Decision recorded: {action} - {reason}")
@@ -259,12 +248,7 @@ class SupervisorAgent(BaseAgent):
             Dictionary with workflow summary
         """
         # Get latest quality score if available
-        latest_score = None
-        critic_feedback = state.scratchpad.get("critic_feedback", [])
-        if critic_feedback:
-            latest_feedback = [f for f in critic_feedback if isinstance(f, dict)]
-            if latest_feedback:
-                latest_score = latest_feedback[-1].get("overall_score")
+        latest_score = state.critic_feedbacks[-1].overall_score if state.critic_feedbacks else None
         
         return {
             "current_iteration": state.iteration_count,
@@ -273,9 +257,9 @@ class SupervisorAgent(BaseAgent):
             "latest_quality_score": latest_score,
             "has_draft": bool(state.current_draft),
             "draft_word_count": len(state.current_draft.split()) if state.current_draft else 0,
-            "total_safety_flags": len(state.scratchpad.get("safety_flags", [])),
-            "total_critic_feedback": len(state.scratchpad.get("critic_feedback", [])),
-            "total_decisions": len(state.scratchpad.get("supervisor_decisions", [])),
+            "total_safety_flags": len(state.safety_flags),
+            "total_critic_feedback": len(state.critic_feedbacks),
+            "total_decisions": len(state.supervisor_decisions) + len(state.scratchpad.get("supervisor_decisions", [])),
             "is_halted": state.should_halt,
             "is_finalized": state.is_finalized,
             "approval_status": str(state.approval_status)
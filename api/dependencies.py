@@ -3,7 +3,7 @@ FastAPI dependencies for dependency injection.
 """
 
 from typing import Optional, Any, Tuple
-from fastapi import HTTPException, Header
+from fastapi import HTTPException, Header, Request
 
 from graph.workflow import create_protocol_workflow
 from state.protocol_state import ProtocolState
@@ -37,6 +37,22 @@ def get_sync_workflow() -> Any:
     return _sync_workflow
 
 
+def get_app_workflow(request: Request) -> Any:
+    """
+    Get the workflow compiled once at startup (see ``lifespan`` in main.py).
+    
+    Compiled with the app-lifetime async checkpointer, so it supports
+    ainvoke/astream without rebuilding the graph per request.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        Compiled workflow with async checkpointer
+    """
+    return request.app.state.workflow
+
+
 async def get_async_workflow():
     """
     Get compiled workflow for async operations (like ainvoke).
@@ -0,0 +1,23 @@
+"""
+Response classes for the API.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    Meant for endpoints that build plain dicts: return an instance directly
+    so FastAPI skips ``jsonable_encoder`` and orjson handles datetimes and
+    enums natively. Endpoints with a ``response_model`` should keep the
+    default response class, which already serializes through Pydantic.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content)
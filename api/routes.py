@@ -2,12 +2,15 @@
 Main API routes for the Cerina Protocol Foundry.
 """
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
 from state.protocol_state import ProtocolState, ApprovalStatus
 from state.schemas import (
@@ -17,20 +20,51 @@ from state.schemas import (
     ResumeRequest,
     HealthResponse,
     DetailedStateResponse,
-    ErrorResponse
+    ErrorResponse,
+    STATE_RESPONSE_ADAPTER,
+    DETAILED_STATE_ADAPTER
 )
-from graph.workflow import create_protocol_workflow, get_workflow_stats
+from graph.workflow import get_workflow_stats
 from graph.streaming import stream_workflow_events
-from database import get_checkpointer, get_async_checkpointer
+from database import get_checkpointer
 from utils.logger import logger
 from config import settings
 
-from .dependencies import get_current_state, verify_api_key
+from .dependencies import get_current_state, get_app_workflow, verify_api_key
+from .responses import ORJSONResponse
 
 
 router = APIRouter(prefix="/api", tags=["protocol"])
 
 
+# Thread update notifications (in-process push for /events/{thread_id})
+
+_thread_update_events: Dict[str, asyncio.Event] = {}
+
+# Statuses at which a workflow run has stopped and waits on a caller
+_SETTLED_STATUSES = {
+    ApprovalStatus.PENDING_HUMAN_REVIEW.value,
+    ApprovalStatus.APPROVED.value,
+    ApprovalStatus.EDITED.value,
+}
+
+
+def _notify_thread_update(thread_id: str):
+    """Wake every /events subscriber waiting on this thread."""
+    event = _thread_update_events.pop(thread_id, None)
+    if event is not None:
+        event.set()
+
+
+async def _wait_for_thread_update(thread_id: str, timeout: float):
+    """Wait until the thread is updated or the timeout passes."""
+    event = _thread_update_events.setdefault(thread_id, asyncio.Event())
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
 # Health Check
 
 @router.get("/health", response_model=HealthResponse)
@@ -57,10 +91,43 @@ async def health_check():
 
 # Protocol Generation
 
+def _build_state_response(state: ProtocolState) -> StateResponse:
+    """
+    Build the public state summary for a protocol state.
+    
+    Args:
+        state: Protocol state
+        
+    Returns:
+        StateResponse for the API
+    """
+    # Validated through the prebuilt adapter (reuses the compiled schema)
+    return STATE_RESPONSE_ADAPTER.validate_python({
+        "thread_id": state.thread_id,
+        "user_intent": state.user_intent,
+        "current_draft": state.current_draft,
+        "final_approved_draft": state.final_approved_draft if state.final_approved_draft else None,
+        "iteration_count": state.iteration_count,
+        "max_iterations": state.max_iterations,
+        "approval_status": state.approval_status,
+        "metadata": state.metadata,
+        "safety_flags_count": len(state.safety_flags),
+        "critic_feedbacks_count": len(state.critic_feedbacks),
+        "has_blocking_issues": state.has_blocking_safety_issues() or state.has_major_quality_issues(),
+        "is_finalized": state.is_finalized,
+        "halted_at_iteration": state.halted_at_iteration,
+        "created_at": state.created_at,
+        "last_modified": state.last_modified,
+        "halted_at": state.halted_at,
+        "approved_at": state.approved_at
+    })
+
+
 @router.post("/generate", response_model=GenerationResponse)
 async def generate_protocol(
     request: GenerationRequest,
     background_tasks: BackgroundTasks,
+    compiled_workflow: Any = Depends(get_app_workflow),
     api_key_valid: bool = Depends(verify_api_key)
 ):
     """
@@ -103,26 +170,18 @@ async def generate_protocol(
         
         logger.info(f"Starting workflow for thread: {thread_id}")
         
-        workflow_graph = create_protocol_workflow()
-        
-        async with get_async_checkpointer() as checkpointer:
-            compiled_workflow = workflow_graph.compile(checkpointer=checkpointer)
-            
-            # Start the graph
-            # It will run until it hits "halt" (Web) or "finalize" (MCP)
+        # Start the graph
+        # It will run until it hits "halt" (Web) or "finalize" (MCP)
+        try:
             result = await compiled_workflow.ainvoke(initial_state, config)
+        finally:
+            _notify_thread_update(thread_id)
         
         # LangGraph returns a dictionary, convert back to object wrapper if needed
-        if isinstance(result, dict):
-            # We construct a temporary object to access fields easily for logging
-            # (Note: Pydantic models expect keyword args)
-            final_status = result.get("approval_status")
-            iteration_count = result.get("iteration_count")
-            created_at = result.get("created_at")
-        else:
-            final_status = result.approval_status
-            iteration_count = result.iteration_count
-            created_at = result.created_at
+        final_state = ProtocolState(**result) if isinstance(result, dict) else result
+        final_status = final_state.approval_status
+        iteration_count = final_state.iteration_count
+        created_at = final_state.created_at
         
         logger.info(f"Workflow completed/halted for thread: {thread_id}")
         logger.info(f"Final state: {final_status}, Iteration: {iteration_count}")
@@ -138,7 +197,8 @@ async def generate_protocol(
             status=str(final_status),
             message=message,
             user_intent=request.user_intent,
-            created_at=created_at or datetime.now()
+            created_at=created_at or datetime.now(),
+            state=_build_state_response(final_state)
         )
         
     except Exception as e:
@@ -150,38 +210,122 @@ async def generate_protocol(
         )
 
 
+@router.post("/generate/stream")
+async def generate_protocol_stream(
+    request: GenerationRequest,
+    compiled_workflow: Any = Depends(get_app_workflow),
+    api_key_valid: bool = Depends(verify_api_key)
+):
+    """
+    Start a new protocol generation workflow and stream its events (SSE).
+    
+    Used by the dashboard to show live agent activity. The stream ends when
+    the workflow halts for human review or is finalized.
+    """
+    logger.info(f"Received streaming generation request: {request.user_intent}")
+    
+    thread_id = str(uuid4())
+    initial_state = ProtocolState(
+        thread_id=thread_id,
+        user_intent=request.user_intent,
+        max_iterations=request.max_iterations or settings.max_agent_iterations,
+        source=getattr(request, "source", "web")
+    )
+    config = {
+        "configurable": {
+            "thread_id": thread_id
+        },
+        "recursion_limit": 50
+    }
+    
+    async def event_stream():
+        try:
+            async for chunk in stream_workflow_events(compiled_workflow, initial_state, config):
+                yield chunk
+        finally:
+            _notify_thread_update(thread_id)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Stop nginx from buffering the stream
+            "X-Thread-ID": thread_id
+        }
+    )
+
+
+@router.get("/events/{thread_id}")
+async def stream_thread_status(
+    thread_id: str,
+    api_key_valid: bool = Depends(verify_api_key)
+):
+    """
+    Push status updates for a workflow thread (SSE).
+    
+    Sends the current status immediately and again whenever a run on the
+    thread finishes, closing once the workflow has settled (halted for
+    review or finalized). Lets clients such as the MCP server wait for
+    completion without polling /state.
+    """
+    # 404 up front for unknown threads
+    get_current_state(thread_id)
+    
+    async def status_events():
+        while True:
+            state = get_current_state(thread_id)
+            status = getattr(state.approval_status, "value", state.approval_status)
+            yield {
+                "event": "status",
+                "data": orjson.dumps({
+                    "thread_id": thread_id,
+                    "approval_status": status,
+                    "iteration_count": state.iteration_count,
+                    "is_finalized": state.is_finalized
+                }).decode()
+            }
+            
+            if state.is_finalized or status in _SETTLED_STATUSES:
+                break
+            
+            # Re-check periodically in case the run happened elsewhere
+            await _wait_for_thread_update(thread_id, timeout=15.0)
+    
+    return EventSourceResponse(status_events(), headers={"X-Accel-Buffering": "no"})
+
+
 # State Management
 
 @router.get("/state/{thread_id}", response_model=StateResponse)
 async def get_state(
     thread_id: str,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated list of fields to return (default: all)"
+    ),
     api_key_valid: bool = Depends(verify_api_key)
 ):
-    """Get the current state of a protocol generation workflow."""
+    """
+    Get the current state of a protocol generation workflow.
+    
+    Pollers that only need the status can pass ``fields`` to skip the
+    draft text in the payload.
+    """
     logger.info(f"Retrieving state for thread: {thread_id}")
     
     try:
         state = get_current_state(thread_id)
         
-        return StateResponse(
-            thread_id=state.thread_id,
-            user_intent=state.user_intent,
-            current_draft=state.current_draft,
-            final_approved_draft=state.final_approved_draft if state.final_approved_draft else None,
-            iteration_count=state.iteration_count,
-            max_iterations=state.max_iterations,
-            approval_status=state.approval_status,
-            metadata=state.metadata,
-            safety_flags_count=len(state.safety_flags),
-            critic_feedbacks_count=len(state.critic_feedbacks),
-            has_blocking_issues=state.has_blocking_safety_issues() or state.has_major_quality_issues(),
-            is_finalized=state.is_finalized,
-            halted_at_iteration=state.halted_at_iteration,
-            created_at=state.created_at,
-            last_modified=state.last_modified,
-            halted_at=state.halted_at,
-            approved_at=state.approved_at
-        )
+        response = _build_state_response(state)
+        
+        if fields:
+            include = {name.strip() for name in fields.split(",") if name.strip()}
+            return ORJSONResponse(response.model_dump(mode="json", include=include))
+        
+        # Already validated: serialize directly instead of re-validating
+        # against response_model
+        return Response(content=STATE_RESPONSE_ADAPTER.dump_json(response), media_type="application/json")
         
     except HTTPException:
         raise
@@ -204,8 +348,10 @@ async def get_detailed_state(
     
     try:
         state = get_current_state(thread_id)
+        # Each entry list is dumped once and shared with the scratchpad view
+        scratchpad = state.to_scratchpad_dict()
         
-        return DetailedStateResponse(
+        response = DetailedStateResponse(
             thread_id=state.thread_id,
             user_intent=state.user_intent,
             current_draft=state.current_draft,
@@ -224,14 +370,17 @@ async def get_detailed_state(
             halted_at=state.halted_at,
             approved_at=state.approved_at,
             draft_versions=[v.model_dump() for v in state.draft_versions],
-            safety_flags=[f.model_dump() for f in state.safety_flags],
-            critic_feedbacks=[f.model_dump() for f in state.critic_feedbacks],
+            safety_flags=scratchpad["safety_flags"],
+            critic_feedbacks=scratchpad["critic_feedback"],
             supervisor_decisions=[d.model_dump() for d in state.supervisor_decisions],
-            drafter_notes=[n.model_dump() for n in state.drafter_notes],
+            drafter_notes=scratchpad["drafter_notes"],
             errors=state.errors,
-            scratchpad=state.scratchpad
+            scratchpad=scratchpad
         )
         
+        # Serialize once to JSON bytes (skips FastAPI's revalidate + re-encode)
+        return Response(content=DETAILED_STATE_ADAPTER.dump_json(response), media_type="application/json")
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -249,6 +398,7 @@ async def get_detailed_state(
 async def resume_workflow(
     thread_id: str,
     request: ResumeRequest,
+    compiled_workflow: Any = Depends(get_app_workflow),
     api_key_valid: bool = Depends(verify_api_key)
 ):
     """Resume a halted workflow after human review."""
@@ -285,37 +435,22 @@ async def resume_workflow(
             raise HTTPException(status_code=400, detail="Invalid action")
             
         # Resume workflow
-        workflow_graph = create_protocol_workflow()
         config = {
             "configurable": {"thread_id": thread_id},
             "recursion_limit": 50
         }
         
-        async with get_async_checkpointer() as checkpointer:
-            compiled_workflow = workflow_graph.compile(checkpointer=checkpointer)
+        try:
             result = await compiled_workflow.ainvoke(state, config)
+        finally:
+            _notify_thread_update(thread_id)
             
         # Refetch state to return response
         final_state = get_current_state(thread_id)
         
-        return StateResponse(
-            thread_id=final_state.thread_id,
-            user_intent=final_state.user_intent,
-            current_draft=final_state.current_draft,
-            final_approved_draft=final_state.final_approved_draft if final_state.final_approved_draft else None,
-            iteration_count=final_state.iteration_count,
-            max_iterations=final_state.max_iterations,
-            approval_status=final_state.approval_status,
-            metadata=final_state.metadata,
-            safety_flags_count=len(final_state.safety_flags),
-            critic_feedbacks_count=len(final_state.critic_feedbacks),
-            has_blocking_issues=final_state.has_blocking_safety_issues() or final_state.has_major_quality_issues(),
-            is_finalized=final_state.is_finalized,
-            halted_at_iteration=final_state.halted_at_iteration,
-            created_at=final_state.created_at,
-            last_modified=final_state.last_modified,
-            halted_at=final_state.halted_at,
-            approved_at=final_state.approved_at
+        return Response(
+            content=STATE_RESPONSE_ADAPTER.dump_json(_build_state_response(final_state)),
+            media_type="application/json"
         )
         
     except HTTPException:
@@ -328,11 +463,11 @@ async def resume_workflow(
 
 # Workflow Stats & Draft Management
 
-@router.get("/workflow/stats/{thread_id}")
+@router.get("/workflow/stats/{thread_id}", response_class=ORJSONResponse)
 async def get_workflow_statistics(thread_id: str, api_key_valid: bool = Depends(verify_api_key)):
     try:
         state = get_current_state(thread_id)
-        return get_workflow_stats(state)
+        return ORJSONResponse(get_workflow_stats(state))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -343,21 +478,32 @@ async def delete_workflow(thread_id: str, api_key_valid: bool = Depends(verify_a
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/draft/{thread_id}")
+@router.get("/draft/{thread_id}", response_class=ORJSONResponse)
 async def get_current_draft(thread_id: str, api_key_valid: bool = Depends(verify_api_key)):
     try:
         state = get_current_state(thread_id)
-        return {
+        return ORJSONResponse({
             "thread_id": thread_id,
             "current_draft": state.current_draft,
             "word_count": len(state.current_draft.split()) if state.current_draft else 0,
             "iteration": state.iteration_count,
             "last_modified": state.last_modified.isoformat() if state.last_modified else None
-        }
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/draft/{thread_id}/raw", response_class=PlainTextResponse)
+async def get_raw_draft(thread_id: str, api_key_valid: bool = Depends(verify_api_key)):
+    """Return the approved draft (or the current one) as plain UTF-8 text."""
+    try:
+        state = get_current_state(thread_id)
+        return PlainTextResponse(state.final_approved_draft or state.current_draft or "")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/draft/{thread_id}/versions")
+@router.get("/draft/{thread_id}/versions", response_class=ORJSONResponse)
 async def get_draft_versions(thread_id: str, api_key_valid: bool = Depends(verify_api_key)):
     try:
         state = get_current_state(thread_id)
@@ -366,6 +512,6 @@ async def get_draft_versions(thread_id: str, api_key_valid: bool = Depends(verif
             "content": v.content,
             "iteration": v.iteration
         } for v in state.draft_versions]
-        return {"thread_id": thread_id, "versions": versions}
+        return ORJSONResponse({"thread_id": thread_id, "versions": versions})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
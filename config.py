@@ -19,10 +19,15 @@ class Settings(BaseSettings):
     # LLM Configuration
     openai_api_key: str = ""
     anthropic_api_key: str = ""
-    primary_llm_provider: Literal["openai", "anthropic"] = "openai"
+    primary_llm_provider: Literal["openai", "anthropic", "vllm"] = "openai"
     openai_model: str = "gpt-4-turbo-preview"
     anthropic_model: str = "claude-3-5-sonnet-20241022"
     
+    # Self-hosted vLLM (OpenAI-compatible server, for offline evaluation runs)
+    vllm_url: str = "http://localhost:8080/v1"
+    vllm_model: str = "meta-llama/Llama-3.1-8B-Instruct"
+    vllm_api_key: str = ""
+    
     # Database
     database_type: Literal["sqlite", "postgresql"] = "sqlite"
     database_url: str = "sqlite:///./cerina_protocol.db"
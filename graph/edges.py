@@ -5,55 +5,98 @@ Edges determine routing between nodes based on state conditions.
 """
 
 from typing import Literal
-from state.protocol_state import ProtocolState
+from state.protocol_state import ProtocolState, HIGH_SEVERITY_RANK
 from agents import SupervisorAgent
-from utils.logger import logger
+from utils.logger import logger, bind_logger
 
 
 def supervisor_router(
     state: ProtocolState
-) -> Literal["drafter", "safety_guardian", "clinical_critic", "halt", "finalize", "max_iterations"]:
+) -> Literal["drafter", "review", "safety_guardian", "clinical_critic", "halt", "finalize"]:
     """
     Supervisor routing logic with MCP bypass support.
+    
+    Emits the single INFO record for the superstep; the per-step traces
+    of the routing logic are logged at DEBUG level.
+    """
+    next_node = _route_from_supervisor(state)
+    
+    bind_logger(
+        thread_id=state.thread_id,
+        iteration=state.iteration_count
+    ).info(f"[Supervisor Router] Routing to: {next_node}")
+    
+    return next_node
+
+
+def _route_from_supervisor(
+    state: ProtocolState
+) -> Literal["drafter", "review", "safety_guardian", "clinical_critic", "halt", "finalize"]:
+    """
+    Decide the next node after the supervisor.
+    
+    Args:
+        state: Current protocol state
+        
+    Returns:
+        Next node name
     """
-    logger.info(f"[Supervisor Router] Evaluating routing (iteration {state.iteration_count})")
+    logger.debug(f"[Supervisor Router] Evaluating routing (iteration {state.iteration_count})")
     
     # ✅ NEW: Check bypass_halt flag (for MCP requests)
     if state.bypass_halt:
-        logger.info("[Supervisor Router] Bypass mode enabled - checking if ready to finalize")
+        logger.debug("[Supervisor Router] Bypass mode enabled - checking if ready to finalize")
         
         # Check if we have a draft and basic validations
         if state.current_draft and state.iteration_count > 0:
-            # Check if we've done at least one round of validation
-            has_safety_check = len(state.safety_flags) > 0
-            has_quality_check = len(state.critic_feedbacks) > 0
-            
-            if has_safety_check and has_quality_check:
-                # Get latest quality score
-                latest_feedback = state.critic_feedbacks[-1] if state.critic_feedbacks else None
-                quality_score = latest_feedback.overall_score if latest_feedback else 0
-                
-                # Check for blocking safety issues
-                has_blocking_safety = any(
-                    f.severity.value == "high" 
-                    for f in state.safety_flags[-3:] if hasattr(f.severity, 'value')
-                )
+            # Only the current draft's own safety and critic results count:
+            # a revision must never be finalized on its predecessor's review
+            if state.is_current_draft_reviewed():
+                # Quality score and max severity of the current draft are
+                # kept as scalars on the state - no list scans needed
+                quality_score = state.latest_quality_score
                 
                 # If quality is acceptable and no blocking issues, finalize
-                if quality_score >= 7.5 and not has_blocking_safety:
-                    logger.info(f"[Supervisor Router] Bypass mode: Quality {quality_score}/10 meets threshold, finalizing")
+                if quality_score >= 7.5 and state.recent_max_severity < HIGH_SEVERITY_RANK:
+                    logger.debug(f"[Supervisor Router] Bypass mode: Quality {quality_score}/10 meets threshold, finalizing")
                     return "finalize"
                 
                 # If we've hit max iterations, finalize anyway
                 if state.iteration_count >= state.max_iterations:
-                    logger.info("[Supervisor Router] Bypass mode: Max iterations reached, finalizing")
+                    logger.debug("[Supervisor Router] Bypass mode: Max iterations reached, finalizing")
                     return "finalize"
+            
+            elif state.last_agent_run == "drafter":
+                # Review a fresh draft before any finalize decision, even
+                # when it was written in the last allowed iteration
+                logger.debug("[Supervisor Router] Bypass mode: Current draft not reviewed, routing to: review")
+                return "review"
     
     # Check if already halted or finalized
     if state.should_halt or state.is_finalized:
-        logger.info("[Supervisor Router] State is halted or finalized, routing to halt")
+        logger.debug("[Supervisor Router] State is halted or finalized, routing to halt")
+        return "halt"
+    
+    # Deterministic short-circuits - the state alone dictates the next node,
+    # so there is no need to consult the supervisor agent
+    if state.iteration_count == 0 or not state.current_draft:
+        logger.debug("[Supervisor Router] No draft yet, routing to: drafter")
+        return "drafter"
+    
+    if state.iteration_count >= state.max_iterations:
+        logger.debug("[Supervisor Router] Max iterations reached, routing to: halt")
         return "halt"
     
+    if state.last_agent_run == "drafter":
+        # Safety and quality reviews only read the draft - run them together
+        logger.debug("[Supervisor Router] Fresh draft, routing to: review")
+        return "review"
+    
+    if state.last_agent_run == "safety_guardian":
+        logger.debug("[Supervisor Router] Safety check done, routing to: clinical_critic")
+        return "clinical_critic"
+    
+    # Only post-critic states (iterate vs. finish) need the supervisor
     # Get supervisor agent
     supervisor = SupervisorAgent()
     
@@ -62,7 +105,7 @@ def supervisor_router(
     
     # ✅ NEW: If bypass mode and supervisor wants to halt, finalize instead
     if state.bypass_halt and decision == "halt_for_human":
-        logger.info("[Supervisor Router] Bypass mode: Converting halt to finalize")
+        logger.debug("[Supervisor Router] Bypass mode: Converting halt to finalize")
         return "finalize"
     
     # Map decision to node name
@@ -71,14 +114,10 @@ def supervisor_router(
         "run_safety": "safety_guardian",
         "run_critic": "clinical_critic",
         "halt_for_human": "halt",
-        "max_iterations_reached": "max_iterations"
+        "max_iterations_reached": "halt"
     }
     
-    next_node = routing_map.get(decision, "halt")
-    
-    logger.info(f"[Supervisor Router] Routing to: {next_node}")
-    
-    return next_node
+    return routing_map.get(decision, "halt")
 
 
 def should_continue(
@@ -98,21 +137,21 @@ def should_continue(
     """
     # Check if explicitly marked to halt
     if state.should_halt:
-        logger.info("[Should Continue] State marked for halt")
+        logger.debug("[Should Continue] State marked for halt")
         return "halt"
     
     # Check if finalized
     if state.is_finalized:
-        logger.info("[Should Continue] State is finalized")
+        logger.debug("[Should Continue] State is finalized")
         return "halt"
     
     # Check max iterations
     if state.iteration_count >= state.max_iterations:
-        logger.info("[Should Continue] Max iterations reached")
+        logger.debug("[Should Continue] Max iterations reached")
         return "halt"
     
     # Continue workflow
-    logger.info("[Should Continue] Continuing workflow")
+    logger.debug("[Should Continue] Continuing workflow")
     return "continue"
 
 
@@ -133,20 +172,20 @@ def human_decision_router(
     """
     from state.protocol_state import ApprovalStatus
     
-    logger.info(f"[Human Decision Router] Human decision: {state.approval_status}")
+    logger.debug(f"[Human Decision Router] Human decision: {state.approval_status}")
     
     if state.approval_status in [ApprovalStatus.APPROVED, ApprovalStatus.EDITED]:
-        logger.info("[Human Decision Router] Approved - routing to finalize")
+        logger.debug("[Human Decision Router] Approved - routing to finalize")
         return "finalize"
     elif state.approval_status == ApprovalStatus.REJECTED:
-        logger.info("[Human Decision Router] Rejected - routing to drafter for revision")
+        logger.debug("[Human Decision Router] Rejected - routing to drafter for revision")
         # Reset halt flag to allow workflow to continue
         state.should_halt = False
         state.needs_revision = True
         return "drafter"
     else:
         # Still pending - stay halted
-        logger.info("[Human Decision Router] Still pending - remaining halted")
+        logger.debug("[Human Decision Router] Still pending - remaining halted")
         return "finalize"  # This shouldn't be reached in normal flow
 
 
@@ -211,3 +250,24 @@ def after_critic_router(
     
     # Normal flow - go to supervisor for decision
     return "supervisor"
+
+
+def after_review_router(
+    state: ProtocolState
+) -> Literal["supervisor", "error"]:
+    """
+    Route after the combined review node completes.
+    
+    Args:
+        state: Current protocol state
+        
+    Returns:
+        Next node
+    """
+    # Check for errors
+    if state.errors and state.errors[-1].get("agent") == "review":
+        logger.error("[After Review Router] Review error detected")
+        return "error"
+    
+    # Normal flow - go to supervisor for decision
+    return "supervisor"
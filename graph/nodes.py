@@ -5,7 +5,8 @@ Each node represents a specific step in the protocol generation workflow,
 typically corresponding to an agent action.
 """
 
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 from state.protocol_state import ProtocolState, AgentRole, SafetySeverity
@@ -15,6 +16,7 @@ from agents import (
     ClinicalCriticAgent,
     SupervisorAgent
 )
+from agents.base_agent import AgentResponse
 from utils.logger import logger
 
 
@@ -69,7 +71,7 @@ def drafter_node(state: ProtocolState) -> ProtocolState:
     Returns:
         Updated state with new draft
     """
-    logger.info(f"[Drafter Node] Starting draft generation (iteration {state.iteration_count})")
+    logger.debug(f"[Drafter Node] Starting draft generation (iteration {state.iteration_count})")
     
     try:
         # Get drafter agent
@@ -82,7 +84,8 @@ def drafter_node(state: ProtocolState) -> ProtocolState:
         state.add_draft_version(
             content=response.content,
             agent=AgentRole.DRAFTER,
-            changes_summary=response.reasoning
+            changes_summary=response.reasoning,
+            word_count=response.metadata.get("word_count")
         )
         
         # Add drafter note to scratchpad
@@ -95,8 +98,9 @@ def drafter_node(state: ProtocolState) -> ProtocolState:
         
         # Increment iteration
         state.increment_iteration()
+        state.last_agent_run = "drafter"
         
-        logger.info(f"[Drafter Node] Draft generation completed (iteration {state.iteration_count})")
+        logger.debug(f"[Drafter Node] Draft generation completed (iteration {state.iteration_count})")
         
         return state
         
@@ -116,7 +120,7 @@ def safety_guardian_node(state: ProtocolState) -> ProtocolState:
     Returns:
         Updated state with safety assessment
     """
-    logger.info(f"[Safety Guardian Node] Starting safety validation (iteration {state.iteration_count})")
+    logger.debug(f"[Safety Guardian Node] Starting safety validation (iteration {state.iteration_count})")
     
     try:
         # Get safety guardian agent
@@ -125,34 +129,11 @@ def safety_guardian_node(state: ProtocolState) -> ProtocolState:
         # Process current state
         response = safety_guardian.process(state)
         
-        # Parse and add safety flags
-        if response.flags:
-            for flag_text in response.flags:
-                # Parse severity from flag text
-                severity = SafetySeverity.MEDIUM  # Default
-                if "HIGH" in flag_text.upper():
-                    severity = SafetySeverity.HIGH
-                elif "LOW" in flag_text.upper():
-                    severity = SafetySeverity.LOW
-                
-                state.add_safety_flag(
-                    severity=severity,
-                    issue=flag_text,
-                    recommendation=response.suggestions[0] if response.suggestions else "Review and revise",
-                    confidence=response.confidence
-                )
-        
-        # Record safety check in scratchpad
-        state.scratchpad["safety_checks"].append({
-            "timestamp": datetime.now().isoformat(),
-            "iteration": state.iteration_count,
-            "agent": "safety_guardian",
-            "rating": response.metadata.get("safety_rating", "UNKNOWN"),
-            "flags_count": len(response.flags),
-            "confidence": response.confidence
-        })
-        
-        logger.info(f"[Safety Guardian Node] Safety validation completed - {len(response.flags)} flags found")
+        _apply_safety_response(state, response)
+        
+        state.last_agent_run = "safety_guardian"
+        
+        logger.debug(f"[Safety Guardian Node] Safety validation completed - {len(response.flags)} flags found")
         
         return state
         
@@ -172,7 +153,7 @@ def clinical_critic_node(state: ProtocolState) -> ProtocolState:
     Returns:
         Updated state with quality assessment
     """
-    logger.info(f"[Clinical Critic Node] Starting quality review (iteration {state.iteration_count})")
+    logger.debug(f"[Clinical Critic Node] Starting quality review (iteration {state.iteration_count})")
     
     try:
         # Get clinical critic agent
@@ -181,22 +162,11 @@ def clinical_critic_node(state: ProtocolState) -> ProtocolState:
         # Process current state
         response = critic.process(state)
         
-        # Extract scores from metadata
-        metadata = response.metadata
-        
-        # Add critic feedback to state
-        state.add_critic_feedback(
-            overall_score=metadata.get("overall_score", 0.0),
-            empathy_score=metadata.get("empathy_score", 0.0),
-            individual_scores=metadata.get("individual_scores", {}),
-            strengths=response.suggestions[:3] if response.suggestions else [],  # First 3 as strengths
-            improvements=response.flags if response.flags else [],
-            recommendation=metadata.get("recommendation", "REVIEW"),
-            feedback=response.content,
-            confidence=response.confidence
-        )
+        _apply_critic_response(state, response)
         
-        logger.info(f"[Clinical Critic Node] Quality review completed - Score: {metadata.get('overall_score', 0)}/10")
+        state.last_agent_run = "clinical_critic"
+        
+        logger.debug(f"[Clinical Critic Node] Quality review completed - Score: {response.metadata.get('overall_score', 0)}/10")
         
         return state
         
@@ -206,6 +176,96 @@ def clinical_critic_node(state: ProtocolState) -> ProtocolState:
         raise
 
 
+async def review_node(state: ProtocolState) -> ProtocolState:
+    """
+    Review node - runs the safety and quality reviews of a fresh draft concurrently.
+    
+    Both reviews read only the draft, so their LLM calls are issued
+    together instead of one after the other.
+    
+    Args:
+        state: Current protocol state
+        
+    Returns:
+        Updated state with safety and quality assessments
+    """
+    logger.debug(f"[Review Node] Starting safety and quality review (iteration {state.iteration_count})")
+    
+    try:
+        safety_response, critic_response = await asyncio.gather(
+            get_safety_guardian().aprocess(state),
+            get_clinical_critic().aprocess(state)
+        )
+        
+        _apply_safety_response(state, safety_response)
+        _apply_critic_response(state, critic_response)
+        
+        state.last_agent_run = "clinical_critic"
+        
+        logger.debug(
+            f"[Review Node] Review completed - {len(safety_response.flags)} flags, "
+            f"Score: {critic_response.metadata.get('overall_score', 0)}/10"
+        )
+        
+        return state
+        
+    except Exception as e:
+        logger.error(f"[Review Node] Error: {str(e)}")
+        state.add_error("review_error", str(e), "review")
+        raise
+
+
+def _apply_safety_response(state: ProtocolState, response: AgentResponse):
+    """Record a safety guardian response on the state."""
+    # Parse and add safety flags
+    if response.flags:
+        for flag_text in response.flags:
+            # Parse severity from flag text
+            severity = SafetySeverity.MEDIUM  # Default
+            if "HIGH" in flag_text.upper():
+                severity = SafetySeverity.HIGH
+            elif "LOW" in flag_text.upper():
+                severity = SafetySeverity.LOW
+            
+            state.add_safety_flag(
+                severity=severity,
+                issue=flag_text,
+                recommendation=response.suggestions[0] if response.suggestions else "Review and revise",
+                confidence=response.confidence
+            )
+    
+    # A clean review raises no flags, so completion is recorded explicitly
+    state.mark_safety_reviewed()
+    
+    # Record safety check in scratchpad
+    state.scratchpad.setdefault("safety_checks", []).append({
+        "timestamp": datetime.now().isoformat(),
+        "iteration": state.iteration_count,
+        "agent": "safety_guardian",
+        "rating": response.metadata.get("safety_rating", "UNKNOWN"),
+        "flags_count": len(response.flags),
+        "confidence": response.confidence
+    })
+
+
+def _apply_critic_response(state: ProtocolState, response: AgentResponse):
+    """Record a clinical critic response on the state."""
+    # Extract scores from metadata
+    metadata = response.metadata
+    
+    # Add critic feedback to state
+    state.add_critic_feedback(
+        overall_score=metadata.get("overall_score", 0.0),
+        empathy_score=metadata.get("empathy_score", 0.0),
+        individual_scores=metadata.get("individual_scores", {}),
+        strengths=response.suggestions[:3] if response.suggestions else [],  # First 3 as strengths
+        improvements=response.flags if response.flags else [],
+        recommendation=metadata.get("recommendation", "REVIEW"),
+        feedback=response.content,
+        confidence=response.confidence
+    )
+
+
 def supervisor_node(state: ProtocolState) -> ProtocolState:
     """
     Supervisor node - makes routing decisions.
@@ -219,7 +279,7 @@ def supervisor_node(state: ProtocolState) -> ProtocolState:
     Returns:
         Updated state with supervisor decision
     """
-    logger.info(f"[Supervisor Node] Evaluating workflow (iteration {state.iteration_count})")
+    logger.debug(f"[Supervisor Node] Evaluating workflow (iteration {state.iteration_count})")
     
     try:
         # Get supervisor agent
@@ -228,7 +288,7 @@ def supervisor_node(state: ProtocolState) -> ProtocolState:
         # Get next action decision
         next_action = supervisor.decide_next_action(state)
         
-        logger.info(f"[Supervisor Node] Decision: {next_action}")
+        logger.debug(f"[Supervisor Node] Decision: {next_action}")
         
         # The actual routing happens in the conditional edge
         # This node just records the decision
@@ -247,21 +307,34 @@ def halt_node(state: ProtocolState) -> ProtocolState:
     This is the critical "human-in-the-loop" interruption point.
     The workflow pauses here and waits for human approval/rejection.
     
+    Also covers the iteration limit: the supervisor router sends a state
+    that hit max_iterations straight here, and the limit is recorded as
+    an error so the reviewer knows validations may be incomplete.
+    
     Args:
         state: Current protocol state
         
     Returns:
         Updated state marked for human review
     """
-    logger.info(f"[Halt Node] Halting for human review (iteration {state.iteration_count})")
+    logger.debug(f"[Halt Node] Halting for human review (iteration {state.iteration_count})")
     
     try:
+        # Note the iteration limit (not for states that were already halted)
+        if not state.should_halt and state.iteration_count >= state.max_iterations:
+            logger.warning(f"[Halt Node] Maximum iterations reached: {state.iteration_count}/{state.max_iterations}")
+            state.add_error(
+                "max_iterations",
+                f"Reached maximum iteration limit ({state.max_iterations}). Current draft may need manual review.",
+                "supervisor"
+            )
+        
         # Mark state as halted
         state.halt_for_human_review()
         
         logger.info(f"[Halt Node] Workflow halted - awaiting human decision")
-        logger.info(f"[Halt Node] Thread ID: {state.thread_id}")
-        logger.info(f"[Halt Node] Current draft length: {len(state.current_draft)} chars")
+        logger.debug(f"[Halt Node] Thread ID: {state.thread_id}")
+        logger.debug(f"[Halt Node] Current draft length: {len(state.current_draft)} chars")
         
         return state
         
@@ -273,7 +346,10 @@ def halt_node(state: ProtocolState) -> ProtocolState:
 
 def finalize_node(state: ProtocolState) -> ProtocolState:
     """
-    Finalize node - completes the workflow after human approval.
+    Finalize node - completes the workflow after approval.
+    
+    Uses the human-edited draft as the approved version when there is one,
+    the current draft otherwise.
     
     Args:
         state: Current protocol state
@@ -281,20 +357,33 @@ def finalize_node(state: ProtocolState) -> ProtocolState:
     Returns:
         Finalized state
     """
-    logger.info(f"[Finalize Node] Finalizing protocol (iteration {state.iteration_count})")
+    return _finalize(state, edited_draft=state.human_edited_draft or None)
+
+
+def _finalize(state: ProtocolState, edited_draft: Optional[str]) -> ProtocolState:
+    """
+    Approve the protocol and log the outcome.
+    
+    Args:
+        state: Current protocol state
+        edited_draft: Human-edited draft (None on the approve path)
+        
+    Returns:
+        Finalized state
+    """
+    # Already approved (e.g. by /resume): approving again would overwrite
+    # final_approved_draft with current_draft
+    if state.is_finalized:
+        return state
+    
+    logger.debug(f"[Finalize Node] Finalizing protocol (iteration {state.iteration_count})")
     
     try:
-        # If not already finalized, mark as complete
-        if not state.is_finalized:
-            # If there's a human-edited draft, use it
-            if state.human_edited_draft:
-                state.approve(edited_draft=state.human_edited_draft)
-            else:
-                state.approve()
+        state.approve(edited_draft=edited_draft)
         
         logger.info(f"[Finalize Node] Protocol finalized successfully")
-        logger.info(f"[Finalize Node] Final status: {state.approval_status}")
-        logger.info(f"[Finalize Node] Total iterations: {state.iteration_count}")
+        logger.debug(f"[Finalize Node] Final status: {state.approval_status}")
+        logger.debug(f"[Finalize Node] Total iterations: {state.iteration_count}")
         
         return state
         
@@ -324,42 +413,6 @@ def error_node(state: ProtocolState) -> ProtocolState:
     return state
 
 
-def max_iterations_node(state: ProtocolState) -> ProtocolState:
-    """
-    Max iterations node - handles reaching iteration limit.
-    
-    When max iterations is reached, the workflow halts for human review
-    even if all validations haven't passed.
-    
-    Args:
-        state: Current protocol state
-        
-    Returns:
-        State marked for human review
-    """
-    logger.warning(f"[Max Iterations Node] Maximum iterations reached: {state.iteration_count}/{state.max_iterations}")
-    
-    try:
-        # Add a note about reaching max iterations
-        state.add_error(
-            "max_iterations",
-            f"Reached maximum iteration limit ({state.max_iterations}). Current draft may need manual review.",
-            "supervisor"
-        )
-        
-        # Halt for human review
-        state.halt_for_human_review()
-        
-        logger.info(f"[Max Iterations Node] Halting for human review due to iteration limit")
-        
-        return state
-        
-    except Exception as e:
-        logger.error(f"[Max Iterations Node] Error: {str(e)}")
-        state.add_error("max_iterations_error", str(e), "max_iterations")
-        raise
-
-
 # Helper node for initialization
 
 def initialize_node(state: ProtocolState) -> ProtocolState:
@@ -373,8 +426,8 @@ def initialize_node(state: ProtocolState) -> ProtocolState:
         Initialized state
     """
     logger.info(f"[Initialize Node] Starting new protocol generation")
-    logger.info(f"[Initialize Node] Thread ID: {state.thread_id}")
-    logger.info(f"[Initialize Node] User Intent: {state.user_intent}")
+    logger.debug(f"[Initialize Node] Thread ID: {state.thread_id}")
+    logger.debug(f"[Initialize Node] User Intent: {state.user_intent}")
     
     # Record initial supervisor decision
     state.add_supervisor_decision(
@@ -4,24 +4,241 @@ Streaming utilities for real-time workflow updates.
 Provides functions to stream workflow execution events to clients.
 """
 
-from typing import AsyncIterator, Dict, Any
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-import json
+import asyncio
+
+import orjson
+from pydantic import BaseModel
 
 from state.protocol_state import ProtocolState
-from state.schemas import StreamEvent
+from state.schemas import StreamEvent, STREAM_EVENT_ADAPTER
 from utils.logger import logger
 
 
+def _encode(event: StreamEvent) -> bytes:
+    """
+    Encode a stream event as an SSE frame.
+    
+    The prebuilt adapter serializes straight to JSON bytes (datetimes
+    included) in one pass, dropping ``None`` fields from the wire, and the
+    bytes go to the StreamingResponse without re-encoding.
+    
+    Args:
+        event: Event to encode
+        
+    Returns:
+        SSE ``data:`` frame as bytes
+    """
+    return b"data: " + STREAM_EVENT_ADAPTER.dump_json(event, exclude_none=True) + b"\n\n"
+
+
+def _status_value(status: Any) -> str:
+    """
+    Plain string for an approval status.
+    
+    The state holds the enum value after validation but the enum member
+    after an unvalidated assignment (e.g. ``halt_for_human_review``); str()
+    of the member would give ``ApprovalStatus.X``.
+    """
+    return getattr(status, "value", status)
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for the few non-native values a payload can hold."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _frame_prefix(node_name: str, event_type: str) -> bytes:
+    """Encode the constant head of a node's SSE frame (without closing brace)."""
+    return b"data: " + orjson.dumps({"event_type": event_type, "agent": node_name})[:-1]
+
+
+def _event_fingerprint(node_name: str, state: ProtocolState) -> tuple:
+    """Key identifying a node event whose payload cannot have changed."""
+    return (
+        node_name,
+        state.iteration_count,
+        state.draft_count,
+        state.safety_flag_count,
+        state.critic_feedback_count,
+        len(state.errors),
+        state.should_halt,
+        state.is_finalized,
+    )
+
+
+def _encode_node_event(
+    node_name: str,
+    state: ProtocolState,
+    cache: Dict[tuple, Tuple[str, str, orjson.Fragment]],
+    timestamp: datetime
+) -> bytes:
+    """
+    Encode the SSE frame for a node update, reusing the serialized payload.
+    
+    The event is built as a plain dict and encoded by orjson, with no
+    StreamEvent model in between. When a node reports again with an
+    unchanged fingerprint (e.g. the supervisor re-evaluating without new
+    flags or feedback), the builder is skipped and the cached ``data`` JSON
+    is spliced into a fresh envelope; only the timestamp is new.
+    
+    Args:
+        node_name: Name of the node that executed
+        state: Updated state after node execution
+        cache: Per-stream payload cache
+        timestamp: Event time
+        
+    Returns:
+        SSE ``data:`` frame as bytes
+    """
+    key = _event_fingerprint(node_name, state)
+    cached = cache.get(key)
+    if cached is None:
+        event = build_stream_event_dict(node_name, state, timestamp)
+        cached = cache[key] = (
+            event["event_type"],
+            event["message"],
+            orjson.Fragment(orjson.dumps(event["data"], default=_json_default))
+        )
+    
+    event_type, message, data = cached
+    prefix = _FRAME_PREFIXES.get((node_name, event_type))
+    if prefix is None:
+        prefix = _FRAME_PREFIXES[(node_name, event_type)] = _frame_prefix(node_name, event_type)
+    
+    return b"".join((
+        prefix,
+        b',"timestamp":', orjson.dumps(timestamp),
+        b',"iteration":', str(state.iteration_count).encode(),
+        b',"data":', orjson.dumps(data),
+        b',"message":', orjson.dumps(message),
+        b"}\n\n",
+    ))
+
+
+async def _coalesce(
+    frames: AsyncIterator[bytes],
+    max_n: int = 8,
+    max_ms: int = 20
+) -> AsyncIterator[bytes]:
+    """
+    Batch SSE frames that arrive in bursts into a single write.
+    
+    A batch is flushed once ``max_n`` frames are buffered or no new frame
+    arrives within ``max_ms``. Frames are concatenated unchanged, so the
+    client still receives one ``data:`` event per stream event.
+    
+    Args:
+        frames: Source of encoded SSE frames
+        max_n: Maximum frames per batch
+        max_ms: Maximum time to wait for the next frame before flushing
+        
+    Yields:
+        One or more concatenated SSE frames
+    """
+    iterator = frames.__aiter__()
+    batch: List[bytes] = []
+    pending: Optional[asyncio.Future] = None
+    
+    try:
+        while True:
+            # Keep the pending __anext__ across flushes instead of cancelling it,
+            # which would tear down the source generator
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            
+            done, _ = await asyncio.wait({pending}, timeout=max_ms / 1000 if batch else None)
+            if not done:
+                yield b"".join(batch)
+                batch = []
+                continue
+            
+            finished, pending = pending, None
+            try:
+                batch.append(finished.result())
+            except StopAsyncIteration:
+                break
+            
+            if len(batch) >= max_n:
+                yield b"".join(batch)
+                batch = []
+        
+        if batch:
+            yield b"".join(batch)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+_END_OF_STREAM = object()
+
+
+async def _buffered(frames: AsyncIterator[bytes], maxsize: int = 64) -> AsyncIterator[bytes]:
+    """
+    Run the frame producer ahead of the client through a bounded queue.
+    
+    The workflow keeps executing while a slow client catches up, but at
+    most ``maxsize`` frames are held; beyond that the producer waits on
+    ``queue.put`` so memory stays bounded.
+    
+    Args:
+        frames: Source of encoded SSE frames
+        maxsize: Maximum number of buffered frames
+        
+    Yields:
+        Frames in production order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    
+    async def produce():
+        try:
+            try:
+                async for frame in frames:
+                    await queue.put(frame)
+            finally:
+                await frames.aclose()
+        except Exception as e:
+            await queue.put(e)
+        # Not reached on cancellation: the consumer is gone and a full queue
+        # would block the sentinel forever
+        await queue.put(_END_OF_STREAM)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
+# Nodes whose own event would repeat the completion event
+_TERMINAL_NODES = frozenset({"halt", "finalize"})
+
+# Nodes that do the work of several agents report one event per agent
+_EVENT_NODES: Dict[str, Tuple[str, ...]] = {"review": ("safety_guardian", "clinical_critic")}
+
+
 async def stream_workflow_events(
     graph,
     initial_state: ProtocolState,
     config: Dict[str, Any]
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """
     Stream workflow execution events in real-time.
     
     This is used for the React dashboard to show live agent activity.
+    Frames are produced ahead of the client through a bounded buffer and
+    bursts of events are coalesced into fewer writes.
     
     Args:
         graph: Compiled workflow graph
@@ -29,11 +246,25 @@ async def stream_workflow_events(
         config: LangGraph config with thread_id
         
     Yields:
-        Server-Sent Events formatted strings
+        Server-Sent Events frames as bytes
     """
+    frames = _buffered(_event_frames(graph, initial_state, config))
+    async for chunk in _coalesce(frames):
+        yield chunk
+
+
+async def _event_frames(
+    graph,
+    initial_state: ProtocolState,
+    config: Dict[str, Any]
+) -> AsyncIterator[bytes]:
+    """Encode each workflow event as its own SSE frame."""
     thread_id = config.get('configurable', {}).get('thread_id', 'unknown')
     logger.info(f"Starting workflow stream for thread: {thread_id}")
     
+    # Serialized payloads for this stream, keyed by event fingerprint
+    payload_cache: Dict[tuple, Tuple[str, str, orjson.Fragment]] = {}
+    
     try:
         # Send initial event
         start_event = StreamEvent(
@@ -43,46 +274,54 @@ async def stream_workflow_events(
             agent="system",
             data={"thread_id": thread_id}
         )
-        yield f"data: {json.dumps(start_event.model_dump(), default=str)}\n\n"
+        yield _encode(start_event)
         
         # Stream graph execution using astream
         async for event in graph.astream(initial_state, config, stream_mode="updates"):
-            # event is a dict with node name as key and updated state as value
+            # event is a dict with node name as key and updated state as value;
+            # every update in one superstep shares a timestamp
+            now = datetime.now()
             for node_name, updated_state in event.items():
                 logger.info(f"Stream event from node: {node_name}")
                 
                 # Handle both dict and ProtocolState responses
                 if isinstance(updated_state, dict):
-                    # Convert dict to ProtocolState
-                    state_obj = ProtocolState(**updated_state)
+                    # Values come from nodes that already produced a validated
+                    # state, so skip re-validation
+                    state_obj = ProtocolState.model_construct(**updated_state)
                 else:
                     state_obj = updated_state
                 
-                # Create stream event
-                stream_event = create_stream_event(node_name, state_obj)
+                is_done = state_obj.should_halt or state_obj.is_finalized
                 
-                # Format as SSE
-                sse_data = f"data: {json.dumps(stream_event.model_dump(), default=str)}\n\n"
-                
-                yield sse_data
+                # Create stream event and format as SSE (the halt/finalize
+                # nodes are covered by the completion event below)
+                if not (is_done and node_name in _TERMINAL_NODES):
+                    for event_node in _EVENT_NODES.get(node_name, (node_name,)):
+                        yield _encode_node_event(event_node, state_obj, payload_cache, now)
                 
                 # Check if halted
-                if state_obj.should_halt or state_obj.is_finalized:
+                if is_done:
                     logger.info("Workflow halted or finalized - stopping stream")
                     
+                    completion_data = {
+                        "thread_id": thread_id,
+                        "approval_status": _status_value(state_obj.approval_status),
+                        "iteration_count": state_obj.iteration_count
+                    }
+                    if not state_obj.is_finalized:
+                        completion_data["halted_at_iteration"] = state_obj.halted_at_iteration
+                    
                     # Send completion event
                     completion_event = StreamEvent(
                         event_type="complete" if state_obj.is_finalized else "halt",
+                        timestamp=now,
                         iteration=state_obj.iteration_count,
                         message="Workflow completed" if state_obj.is_finalized else "Workflow halted for human review",
                         agent="system",
-                        data={
-                            "thread_id": thread_id,
-                            "approval_status": str(state_obj.approval_status),
-                            "iteration_count": state_obj.iteration_count
-                        }
+                        data=completion_data
                     )
-                    yield f"data: {json.dumps(completion_event.model_dump(), default=str)}\n\n"
+                    yield _encode(completion_event)
                     break
         
         logger.info(f"Stream completed for thread: {thread_id}")
@@ -98,100 +337,175 @@ async def stream_workflow_events(
             agent="system",
             data={"error_type": type(e).__name__}
         )
-        yield f"data: {json.dumps(error_event.model_dump(), default=str)}\n\n"
+        yield _encode(error_event)
 
 
-def create_stream_event(node_name: str, state: ProtocolState) -> StreamEvent:
-    """
-    Create a stream event from node execution.
-    
-    Args:
-        node_name: Name of the node that executed
-        state: Updated state after node execution
-        
-    Returns:
-        StreamEvent object
-    """
-    event_type = "agent_start"
-    agent = node_name
-    message = f"{node_name} is processing"
-    data = {}
-    
-    # Customize based on node
-    if node_name == "initialize":
-        event_type = "agent_start"
-        message = "Initializing workflow"
-        data = {
-            "thread_id": state.thread_id,
-            "user_intent": state.user_intent,
-            "max_iterations": state.max_iterations
-        }
+# Static fields per node, built once; the builders below only fill in the
+# fields that depend on the state.
+_DEFAULT_TEMPLATE: Dict[str, Any] = {"event_type": "agent_start"}
+
+_NODE_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "initialize": {"event_type": "agent_start", "message": "Initializing workflow"},
+    "drafter": {"event_type": "draft_update"},
+    "safety_guardian": {"event_type": "agent_end"},
+    "clinical_critic": {"event_type": "agent_end"},
+    "supervisor": {"event_type": "agent_start", "message": "Supervisor evaluating next action"},
+    "halt": {"event_type": "halt", "message": "Workflow halted for human review"},
+    "finalize": {"event_type": "complete", "message": "Protocol finalized successfully"},
+    "error": {"event_type": "error", "message": "Error occurred in workflow"},
+}
+
+# Pre-encoded frame heads per (node, event_type), filled at import for the
+# known nodes and on first use for any other node
+_FRAME_PREFIXES: Dict[Tuple[str, str], bytes] = {
+    (node_name, template["event_type"]): _frame_prefix(node_name, template["event_type"])
+    for node_name, template in _NODE_TEMPLATES.items()
+}
+
+
+def _build_initialize(state: ProtocolState) -> Dict[str, Any]:
+    return {"data": {
+        "thread_id": state.thread_id,
+        "user_intent": state.user_intent,
+        "max_iterations": state.max_iterations
+    }}
+
+
+def _build_drafter(state: ProtocolState) -> Dict[str, Any]:
+    draft = state.current_draft
+    if not draft:
+        preview, word_count = "No draft yet", 0
+    else:
+        preview = draft[:200] + "..." if len(draft) > 200 else draft
+        # The current draft is normally the latest version, whose word count
+        # was taken when it was added
+        latest = state.draft_versions[-1] if state.draft_versions else None
+        word_count = latest.word_count if latest is not None and latest.content == draft else len(draft.split())
     
-    elif node_name == "drafter":
-        event_type = "draft_update"
-        message = f"Drafter generated new draft (iteration {state.iteration_count})"
-        data = {
-            "draft_preview": state.current_draft[:200] + "..." if state.current_draft else "No draft yet",
-            "word_count": len(state.current_draft.split()) if state.current_draft else 0,
-            "version": len(state.draft_versions)
+    return {
+        "message": f"Drafter generated new draft (iteration {state.iteration_count})",
+        "data": {
+            "draft_preview": preview,
+            "word_count": word_count,
+            "version": state.draft_count
         }
-    
-    elif node_name == "safety_guardian":
-        event_type = "agent_end"
-        latest_flags = state.safety_flags[-3:] if state.safety_flags else []
-        message = f"Safety check completed - {len(latest_flags)} issues found"
-        data = {
-            "flags_count": len(state.safety_flags),
+    }
+
+
+def _build_safety_guardian(state: ProtocolState) -> Dict[str, Any]:
+    latest_flags = state.safety_flags[-3:] if state.safety_flags else []
+    return {
+        "message": f"Safety check completed - {len(latest_flags)} issues found",
+        "data": {
+            "flags_count": state.safety_flag_count,
             "latest_flags": [f.issue for f in latest_flags] if latest_flags else []
         }
+    }
+
+
+def _build_clinical_critic(state: ProtocolState) -> Dict[str, Any]:
+    latest_feedback = state.get_latest_critic_feedback()
+    if latest_feedback is None:
+        # No review recorded - don't send placeholder scores
+        return {"message": "Quality review completed - Score: 0/10", "data": {}}
     
-    elif node_name == "clinical_critic":
-        event_type = "agent_end"
-        latest_feedback = state.get_latest_critic_feedback()
-        score = latest_feedback.overall_score if latest_feedback else 0
-        message = f"Quality review completed - Score: {score}/10"
-        data = {
-            "overall_score": score,
-            "empathy_score": latest_feedback.empathy_score if latest_feedback else 0,
-            "recommendation": latest_feedback.recommendation if latest_feedback else "N/A"
-        }
-    
-    elif node_name == "supervisor":
-        event_type = "agent_start"
-        message = "Supervisor evaluating next action"
-        data = {
-            "iteration": state.iteration_count,
-            "max_iterations": state.max_iterations
+    return {
+        "message": f"Quality review completed - Score: {latest_feedback.overall_score}/10",
+        "data": {
+            "overall_score": latest_feedback.overall_score,
+            "empathy_score": latest_feedback.empathy_score,
+            "recommendation": latest_feedback.recommendation
         }
+    }
+
+
+def _build_supervisor(state: ProtocolState) -> Dict[str, Any]:
+    return {"data": {
+        "iteration": state.iteration_count,
+        "max_iterations": state.max_iterations
+    }}
+
+
+def _build_halt(state: ProtocolState) -> Dict[str, Any]:
+    return {"data": {
+        "thread_id": state.thread_id,
+        "halted_at_iteration": state.halted_at_iteration
+    }}
+
+
+def _build_finalize(state: ProtocolState) -> Dict[str, Any]:
+    return {"data": {
+        "approval_status": _status_value(state.approval_status),
+        "total_iterations": state.iteration_count
+    }}
+
+
+def _build_error(state: ProtocolState) -> Dict[str, Any]:
+    return {"data": {"errors": state.errors}}
+
+
+# Node name -> builder for the state-dependent event fields
+_BUILDERS: Dict[str, Callable[[ProtocolState], Dict[str, Any]]] = {
+    "initialize": _build_initialize,
+    "drafter": _build_drafter,
+    "safety_guardian": _build_safety_guardian,
+    "clinical_critic": _build_clinical_critic,
+    "supervisor": _build_supervisor,
+    "halt": _build_halt,
+    "finalize": _build_finalize,
+    "error": _build_error,
+}
+
+
+def build_stream_event_dict(
+    node_name: str,
+    state: ProtocolState,
+    timestamp: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Build the fields of a stream event for a node execution.
     
-    elif node_name == "halt":
-        event_type = "halt"
-        message = "Workflow halted for human review"
-        data = {
-            "thread_id": state.thread_id,
-            "halted_at_iteration": state.halted_at_iteration
-        }
+    Returns the same shape as ``StreamEvent`` without constructing (and
+    later dumping) the model, for the streaming hot path.
     
-    elif node_name == "finalize":
-        event_type = "complete"
-        message = "Protocol finalized successfully"
-        data = {
-            "approval_status": str(state.approval_status),
-            "total_iterations": state.iteration_count
-        }
+    Args:
+        node_name: Name of the node that executed
+        state: Updated state after node execution
+        timestamp: Event time (defaults to now)
+        
+    Returns:
+        Dictionary with the StreamEvent fields
+    """
+    template = _NODE_TEMPLATES.get(node_name, _DEFAULT_TEMPLATE)
+    builder = _BUILDERS.get(node_name)
+    if builder is not None:
+        dynamic = builder(state)
+    else:
+        dynamic = {"message": f"{node_name} is processing", "data": {}}
     
-    elif node_name == "error":
-        event_type = "error"
-        message = "Error occurred in workflow"
-        data = {
-            "errors": state.errors
-        }
+    return {
+        "timestamp": timestamp or datetime.now(),
+        "agent": node_name,
+        "iteration": state.iteration_count,
+        **template,
+        **dynamic
+    }
+
+
+def create_stream_event(
+    node_name: str,
+    state: ProtocolState,
+    timestamp: Optional[datetime] = None
+) -> StreamEvent:
+    """
+    Create a stream event from node execution.
     
-    return StreamEvent(
-        event_type=event_type,
-        timestamp=datetime.now(),
-        agent=agent,
-        iteration=state.iteration_count,
-        data=data,
-        message=message
-    )
+    Args:
+        node_name: Name of the node that executed
+        state: Updated state after node execution
+        timestamp: Event time (defaults to now)
+        
+    Returns:
+        StreamEvent object
+    """
+    return StreamEvent(**build_stream_event_dict(node_name, state, timestamp))
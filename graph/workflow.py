@@ -4,7 +4,9 @@ Main LangGraph workflow definition.
 This module creates and compiles the complete protocol generation workflow graph.
 """
 
-from typing import Optional, Any
+import heapq
+from dataclasses import asdict
+from typing import Optional, Any, Dict, Iterator, Tuple
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
@@ -17,17 +19,18 @@ from .nodes import (
     drafter_node,
     safety_guardian_node,
     clinical_critic_node,
+    review_node,
     supervisor_node,
     halt_node,
     finalize_node,
-    max_iterations_node,
     error_node
 )
 from .edges import (
     supervisor_router,
     after_drafter_router,
     after_safety_router,
-    after_critic_router
+    after_critic_router,
+    after_review_router
 )
 
 
@@ -37,7 +40,7 @@ def create_protocol_workflow() -> StateGraph:
     
     Workflow Structure:
     1. Initialize
-    2. Enter agent loop (Drafter -> Safety -> Critic)
+    2. Enter agent loop (Drafter -> Review: Safety || Critic)
     3. Supervisor makes routing decisions
     4. Halt for human review
     5. Finalize based on human decision
@@ -56,10 +59,10 @@ def create_protocol_workflow() -> StateGraph:
     workflow.add_node("drafter", drafter_node)
     workflow.add_node("safety_guardian", safety_guardian_node)
     workflow.add_node("clinical_critic", clinical_critic_node)
+    workflow.add_node("review", review_node)
     workflow.add_node("supervisor", supervisor_node)
     workflow.add_node("halt", halt_node)
     workflow.add_node("finalize", finalize_node)
-    workflow.add_node("max_iterations", max_iterations_node)
     workflow.add_node("error", error_node)
     
     # Set entry point
@@ -77,10 +80,11 @@ def create_protocol_workflow() -> StateGraph:
         supervisor_router,
         {
             "drafter": "drafter",
+            "review": "review",
             "safety_guardian": "safety_guardian",
             "clinical_critic": "clinical_critic",
             "halt": "halt",
-            "max_iterations": "max_iterations"
+            "finalize": "finalize"
         }
     )
     
@@ -114,13 +118,20 @@ def create_protocol_workflow() -> StateGraph:
         }
     )
     
+    # After Review (safety + critic in parallel) -> Back to Supervisor
+    workflow.add_conditional_edges(
+        "review",
+        after_review_router,
+        {
+            "supervisor": "supervisor",
+            "error": "error"
+        }
+    )
+    
     # Halt -> END (workflow pauses here for human review)
     workflow.add_edge("halt", END)
     
-    # Max Iterations -> Halt -> END
-    workflow.add_edge("max_iterations", "halt")
-    
-    # Finalize -> END
+    # Finalize (approved / edited) -> END
     workflow.add_edge("finalize", END)
     
     # Error -> END
@@ -163,14 +174,7 @@ async def compile_workflow_async(checkpointer: Optional[Any] = None) -> Any:
 
 
 
-def create_workflow_diagram() -> str:
-    """
-    Generate a text representation of the workflow for documentation.
-    
-    Returns:
-        Workflow diagram as string
-    """
-    diagram = """
+_WORKFLOW_DIAGRAM = """
     Cerina Protocol Foundry - Workflow Diagram
     ==========================================
     
@@ -182,9 +186,9 @@ def create_workflow_diagram() -> str:
       ↓                                │
     (Decision)                         │
       ├─→ [Drafter] ──────────────────┤
+      ├─→ [Review: Safety ∥ Critic] ──┤
       ├─→ [Safety Guardian] ──────────┤
       ├─→ [Clinical Critic] ──────────┤
-      ├─→ [Max Iterations] → [Halt]   │
       └─→ [Halt] ─────────────────────┘
            ↓
     (Human Review)
@@ -199,7 +203,16 @@ def create_workflow_diagram() -> str:
     - → = Edge (flow direction)
     - ← = Loop back
     """
-    return diagram
+
+
+def create_workflow_diagram() -> str:
+    """
+    Generate a text representation of the workflow for documentation.
+    
+    Returns:
+        Workflow diagram as string
+    """
+    return _WORKFLOW_DIAGRAM
 
 
 # Workflow introspection utilities
@@ -219,97 +232,108 @@ def get_workflow_stats(state: ProtocolState) -> dict:
         "iterations_completed": state.iteration_count,
         "max_iterations": state.max_iterations,
         "total_agents_run": (
-            len(state.drafter_notes) +
-            len(state.safety_flags) +
-            len(state.critic_feedbacks)
+            state.drafter_note_count +
+            state.safety_flag_count +
+            state.critic_feedback_count
         ),
-        "supervisor_decisions": len(state.supervisor_decisions),
-        "draft_versions": len(state.draft_versions),
-        "safety_flags": len(state.safety_flags),
-        "critic_feedbacks": len(state.critic_feedbacks),
+        "supervisor_decisions": state.supervisor_decision_count,
+        "draft_versions": state.draft_count,
+        "safety_flags": state.safety_flag_count,
+        "critic_feedbacks": state.critic_feedback_count,
         "errors": len(state.errors),
         "is_halted": state.should_halt,
         "is_finalized": state.is_finalized,
         "approval_status": state.approval_status,
-        "metadata_scores": state.metadata.model_dump()
+        "metadata_scores": asdict(state.metadata)
     }
 
 
+# Rendered traces per thread, reused while the state has not changed
+_TRACE_CACHE: Dict[str, Tuple[tuple, str]] = {}
+_TRACE_CACHE_SIZE = 128
+
+
 def visualize_workflow_execution(state: ProtocolState) -> str:
     """
     Create a visual representation of the workflow execution path.
     
+    The trace only changes when entries are added or the status moves,
+    so repeated polls of an unchanged thread return the cached text.
+    
     Args:
         state: Current protocol state
         
     Returns:
         Visual execution trace
     """
-    lines = [
-        "Workflow Execution Trace",
-        "=" * 50,
-        f"Thread ID: {state.thread_id}",
-        f"User Intent: {state.user_intent}",
-        f"Status: {state.approval_status}",
-        "",
-        "Execution Path:",
-    ]
-    
-    # Build execution timeline
-    all_events = []
-    
-    # Add drafter events
-    for note in state.drafter_notes:
-        all_events.append({
-            "timestamp": note.timestamp,
-            "iteration": note.iteration,
-            "agent": "Drafter",
-            "action": "Generated draft"
-        })
-    
-    # Add safety events
-    for flag in state.safety_flags:
-        all_events.append({
-            "timestamp": flag.timestamp,
-            "iteration": flag.iteration,
-            "agent": "Safety Guardian",
-            "action": f"Safety check - {flag.severity}"
-        })
-    
-    # Add critic events
-    for feedback in state.critic_feedbacks:
-        all_events.append({
-            "timestamp": feedback.timestamp,
-            "iteration": feedback.iteration,
-            "agent": "Clinical Critic",
-            "action": f"Quality review - {feedback.overall_score}/10"
-        })
-    
-    # Add supervisor events
-    for decision in state.supervisor_decisions:
-        all_events.append({
-            "timestamp": decision.timestamp,
-            "iteration": decision.iteration,
-            "agent": "Supervisor",
-            "action": f"Decision: {decision.action}"
-        })
-    
-    # Sort by timestamp
-    all_events.sort(key=lambda x: x["timestamp"])
+    key = (
+        state.iteration_count,
+        str(state.approval_status),
+        state.drafter_note_count,
+        state.safety_flag_count,
+        state.critic_feedback_count,
+        state.supervisor_decision_count,
+        state.draft_count,
+    )
+    cached = _TRACE_CACHE.get(state.thread_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    trace = _render_execution_trace(state)
+    
+    _TRACE_CACHE.pop(state.thread_id, None)
+    if len(_TRACE_CACHE) >= _TRACE_CACHE_SIZE:
+        # Evict the least recently stored thread
+        _TRACE_CACHE.pop(next(iter(_TRACE_CACHE)))
+    _TRACE_CACHE[state.thread_id] = (key, trace)
+    
+    return trace
+
+
+def _render_execution_trace(state: ProtocolState) -> str:
+    """Format the execution trace for a state."""
+    return "\n".join(_iter_trace_lines(state))
+
+
+def _iter_trace_lines(state: ProtocolState) -> Iterator[str]:
+    """Yield the lines of the execution trace in order."""
+    yield "Workflow Execution Trace"
+    yield "=" * 50
+    yield f"Thread ID: {state.thread_id}"
+    yield f"User Intent: {state.user_intent}"
+    yield f"Status: {state.approval_status}"
+    yield ""
+    yield "Execution Path:"
+    
+    # Build execution timeline: each list is appended in time order, so
+    # merging the four sorted runs avoids a full sort
+    drafter_events = (
+        (note.timestamp, note.iteration, "Drafter", "Generated draft")
+        for note in state.drafter_notes
+    )
+    safety_events = (
+        (flag.timestamp, flag.iteration, "Safety Guardian", f"Safety check - {flag.severity}")
+        for flag in state.safety_flags
+    )
+    critic_events = (
+        (feedback.timestamp, feedback.iteration, "Clinical Critic", f"Quality review - {feedback.overall_score}/10")
+        for feedback in state.critic_feedbacks
+    )
+    supervisor_events = (
+        (decision.timestamp, decision.iteration, "Supervisor", f"Decision: {decision.action}")
+        for decision in state.supervisor_decisions
+    )
     
     # Format events
-    for event in all_events:
-        timestamp_str = event["timestamp"].strftime("%H:%M:%S")
-        lines.append(
-            f"  [{timestamp_str}] Iteration {event['iteration']}: "
-            f"{event['agent']} - {event['action']}"
-        )
-    
-    lines.extend([
-        "",
-        f"Final Status: {state.approval_status}",
-        f"Total Iterations: {state.iteration_count}",
-        f"Draft Versions: {len(state.draft_versions)}",
-    ])
-    
-    return "\n".join(lines)
+    for timestamp, iteration, agent, action in heapq.merge(
+        drafter_events, safety_events, critic_events, supervisor_events,
+        key=lambda event: event[0]
+    ):
+        # HH:MM:SS slice of the ISO form; cheaper than strftime
+        timestamp_str = timestamp.isoformat(timespec="seconds")[11:19]
+        yield f"  [{timestamp_str}] Iteration {iteration}: {agent} - {action}"
+    
+    yield ""
+    yield f"Final Status: {state.approval_status}"
+    yield f"Total Iterations: {state.iteration_count}"
+    yield f"Draft Versions: {state.draft_count}"
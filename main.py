@@ -17,20 +17,22 @@ Author: Cerina Health - Agentic Architect Sprint
 
 import sys
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, AsyncExitStack
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 
 from config import settings
-from database import init_database, get_checkpointer
+from database import init_database, get_checkpointer, get_async_checkpointer
 from utils.logger import logger, log_exception
 from api.routes import router as api_router
 from api.websocket import websocket_endpoint
 from api.middleware import LoggingMiddleware
+from api.responses import ORJSONResponse
 from api.error_handlers import (
     http_exception_handler,
     validation_exception_handler,
@@ -70,6 +72,7 @@ async def lifespan(app: FastAPI):
     - Resource cleanup
     """
     # Startup
+    resources = AsyncExitStack()
     logger.info(BANNER)
     logger.info("=" * 70)
     logger.info("Starting Cerina Protocol Foundry")
@@ -79,12 +82,15 @@ async def lifespan(app: FastAPI):
         # Initialize database and checkpointer
         logger.info("Initializing database and checkpointing system...")
         init_database()
-        checkpointer = get_checkpointer()
+        # Warm the shared sync checkpointer used by the state endpoints
+        get_checkpointer()
         logger.info(f"✓ Database initialized: {settings.database_type}")
         
-        # Compile workflow
+        # Compile workflow once; request handlers reuse it. The async
+        # checkpointer stays open for the lifetime of the app.
         logger.info("Compiling LangGraph workflow...")
-        workflow = compile_workflow_async(checkpointer)
+        async_checkpointer = await resources.enter_async_context(get_async_checkpointer())
+        workflow = await compile_workflow_async(async_checkpointer)
         app.state.workflow = workflow
         logger.info("✓ Workflow compiled successfully")
         
@@ -116,6 +122,7 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start application: {str(e)}")
         log_exception(e, "Startup failed")
+        await resources.aclose()
         raise
     
     # Shutdown
@@ -127,8 +134,9 @@ async def lifespan(app: FastAPI):
         # Cleanup resources
         logger.info("Cleaning up resources...")
         
-        # Close database connections
-        # (handled automatically by SQLAlchemy/SQLite)
+        # Close the async checkpointer connection
+        # (sync connections are handled automatically by SQLAlchemy/SQLite)
+        await resources.aclose()
         
         logger.info("✓ Cleanup completed")
         logger.info("👋 Cerina Protocol Foundry stopped successfully")
@@ -203,6 +211,12 @@ app.add_middleware(
 )
 
 
+# Compression (JSON responses; text/event-stream is excluded by default so
+# SSE frames are not held back in the gzip buffer)
+
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+
 # Custom Middleware
 
 app.add_middleware(LoggingMiddleware)
@@ -228,14 +242,14 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
-@app.get("/info")
+@app.get("/info", response_class=ORJSONResponse)
 async def info():
     """
     Get application information.
     
     Returns basic information about the service, configuration, and capabilities.
     """
-    return {
+    return ORJSONResponse({
         "name": "Cerina Protocol Foundry",
         "version": "1.0.0",
         "description": "Multi-Agent AI System for Autonomous CBT Protocol Generation",
@@ -275,20 +289,20 @@ async def info():
             "resume": "/api/resume/{thread_id}",
             "websocket": "/ws/{thread_id}"
         }
-    }
+    })
 
 
-@app.get("/workflow/diagram")
+@app.get("/workflow/diagram", response_class=ORJSONResponse)
 async def workflow_diagram():
     """
     Get the workflow diagram as text.
     
     Returns a text representation of the agent workflow topology.
     """
-    return {
+    return ORJSONResponse({
         "diagram": create_workflow_diagram(),
         "format": "text"
-    }
+    })
 
 
 # WebSocket Endpoint
@@ -13,7 +13,12 @@ from .llm_client import (
     LLMClient,
     OpenAIClient,
     AnthropicClient,
-    count_tokens
+    VLLMClient,
+    CachedLLMClient,
+    RateLimitError,
+    ServerError,
+    count_tokens,
+    count_tokens_batch
 )
 from .prompts import (
     DRAFTER_SYSTEM_PROMPT,
@@ -30,7 +35,12 @@ __all__ = [
     "LLMClient",
     "OpenAIClient",
     "AnthropicClient",
+    "VLLMClient",
+    "CachedLLMClient",
+    "RateLimitError",
+    "ServerError",
     "count_tokens",
+    "count_tokens_batch",
     "DRAFTER_SYSTEM_PROMPT",
     "SAFETY_GUARDIAN_SYSTEM_PROMPT",
     "CLINICAL_CRITIC_SYSTEM_PROMPT",
@@ -2,17 +2,185 @@
 Unified LLM client interface supporting multiple providers.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Literal
-from dataclasses import dataclass
-import tiktoken
+from __future__ import annotations
 
-from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, AIMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Mapping, Optional, Tuple
+from collections import defaultdict
+from dataclasses import asdict, dataclass, replace
+import asyncio
+import functools
+import hashlib
+import os
+import struct
+import threading
+import httpx
+import orjson
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 from config import settings
 from utils.logger import logger
+from models.prompts import get_prompt_version
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+if TYPE_CHECKING:
+    # Annotations only; tiktoken is imported lazily on first token count
+    import tiktoken
+    from langchain_core.messages import BaseMessage
+
+
+# Shared HTTP clients (keep-alive pools to the provider APIs). The sync
+# client serves the LangGraph nodes, which run in worker threads; the async
+# client serves ainvoke.
+
+_HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=60)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared sync HTTP client, creating it on first use."""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(http2=HAS_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    
+    return _http_client
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use."""
+    global _async_http_client
+    
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(http2=HAS_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    
+    return _async_http_client
+
+
+# Message type -> chat API role
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+def _iter_sse_data(chunks):
+    """
+    Yield decoded JSON payloads from raw SSE byte chunks until [DONE].
+    
+    Lines are split and parsed as bytes (orjson reads them directly), so no
+    intermediate str is decoded per line.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end].strip()
+            start = end + 1
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                return
+            yield orjson.loads(data)
+        del buffer[:start]
+
+
+class RateLimitError(httpx.HTTPStatusError):
+    """Provider rejected the request with 429 Too Many Requests."""
+
+
+class ServerError(httpx.HTTPStatusError):
+    """Provider failed with a 5xx status."""
+
+
+def _raise_for_status(response: httpx.Response):
+    """
+    Raise for an error response, classifying retryable statuses.
+    
+    Raises:
+        RateLimitError: On 429
+        ServerError: On 5xx
+        httpx.HTTPStatusError: On any other 4xx (not retried)
+    """
+    if response.status_code == 429:
+        raise RateLimitError("Rate limited by provider (429)", request=response.request, response=response)
+    if response.status_code >= 500:
+        raise ServerError(
+            f"Provider server error ({response.status_code})", request=response.request, response=response
+        )
+    response.raise_for_status()
+
+
+# Retry transient failures (timeouts, connection errors, 429, 5xx) with
+# jittered exponential backoff; client errors like 400/401 propagate at once
+_retry_transient = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=0.5, max=10),
+    retry=retry_if_exception_type((httpx.TransportError, RateLimitError, ServerError)),
+    reraise=True
+)
+
+
+# Known model names -> context window in tokens. Only these exact names
+# (e.g. bare "gpt-4" is the 8k model, not gpt-4.1 or gpt-4o)
+_CONTEXT_WINDOWS_EXACT = {
+    "gpt-4": 8_192,
+    "gpt-4-0314": 8_192,
+    "gpt-4-0613": 8_192,
+    "gpt-4-1106-preview": 128_000,
+    "gpt-4-0125-preview": 128_000,
+    "gpt-4-vision-preview": 128_000,
+}
+
+# Model families -> context window in tokens. A family matches its own name
+# or any "<family>-..." variant (dated snapshots, -mini, ...)
+_CONTEXT_WINDOW_FAMILIES = {
+    "gpt-4o": 128_000,
+    "gpt-4-turbo": 128_000,
+    "gpt-4-32k": 32_768,
+    "gpt-3.5-turbo": 16_385,
+    "claude-3": 200_000,
+    "claude-sonnet-4": 200_000,
+    "claude-opus-4": 200_000,
+    "claude-haiku-4": 200_000,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _context_window(model: str) -> Optional[int]:
+    """
+    Look up the context window of a model.
+    
+    Args:
+        model: Model name
+        
+    Returns:
+        Window in tokens, or None for models not in the tables (the
+        pre-flight check is skipped rather than guessing a window)
+    """
+    if model in _CONTEXT_WINDOWS_EXACT:
+        return _CONTEXT_WINDOWS_EXACT[model]
+    
+    # Longest family first, so e.g. gpt-4-32k is not read as a shorter family
+    for family in sorted(_CONTEXT_WINDOW_FAMILIES, key=len, reverse=True):
+        if model == family or model.startswith(family + "-"):
+            return _CONTEXT_WINDOW_FAMILIES[family]
+    
+    return None
 
 
 @dataclass
@@ -65,6 +233,51 @@ class LLMClient(ABC):
         """
         pass
     
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke the LLM without blocking the event loop.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
+            
+        Returns:
+            LLMResponse object
+        """
+        return await asyncio.to_thread(self.invoke, messages, **kwargs)
+    
+    def _check_context_window(self, messages: List[BaseMessage], max_tokens: int):
+        """
+        Reject prompts that can't fit the model's context window before sending.
+        
+        Args:
+            messages: List of messages
+            max_tokens: Tokens reserved for the response
+            
+        Raises:
+            ValueError: If prompt plus response budget exceeds the window
+        """
+        window = _context_window(self.model)
+        if window is None:
+            return
+        
+        # A token is at least one UTF-8 byte (at most 4 per char), so short
+        # prompts can skip tokenization entirely
+        budget = window - max_tokens
+        if sum(len(message.content) for message in messages) * 4 <= budget:
+            return
+        
+        prompt_tokens = sum(count_tokens_batch([message.content for message in messages], self.model))
+        if prompt_tokens > budget:
+            raise ValueError(
+                f"Prompt is {prompt_tokens} tokens; {self.model} allows {budget} "
+                f"with max_tokens={max_tokens} (context window {window})"
+            )
+    
     @abstractmethod
     def stream(
         self,
@@ -82,17 +295,40 @@ class LLMClient(ABC):
             Response chunks
         """
         pass
+    
+    def collect_stream(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> str:
+        """
+        Stream a response and return the full text.
+        
+        Chunks are buffered and joined once at the end instead of being
+        concatenated as they arrive.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
+            
+        Returns:
+            Complete response text
+        """
+        return "".join(self.stream(messages, **kwargs))
 
 
 class OpenAIClient(LLMClient):
-    """OpenAI LLM client implementation."""
+    """OpenAI LLM client implementation (Chat Completions over the shared HTTP pool)."""
+    
+    API_URL = "https://api.openai.com/v1/chat/completions"
     
     def __init__(
         self,
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None
     ):
         """
         Initialize OpenAI client.
@@ -102,6 +338,8 @@ class OpenAIClient(LLMClient):
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
             api_key: OpenAI API key (default from settings)
+            prompt_cache_key: Routing key so requests sharing a system
+                prompt hit the same provider-side prompt cache
         """
         model = model or settings.openai_model
         super().__init__(model, temperature, max_tokens)
@@ -111,16 +349,48 @@ class OpenAIClient(LLMClient):
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
-        # Initialize LangChain client
-        self.client = ChatOpenAI(
-            model=self.model,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            api_key=self.api_key
-        )
+        self.prompt_cache_key = prompt_cache_key
+        
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "content-type": "application/json"
+        }
         
         self.logger.info(f"OpenAI client initialized with model: {self.model}")
     
+    def _build_payload(self, messages: List[BaseMessage], stream: bool = False, **kwargs) -> bytes:
+        """Serialize a Chat Completions request body."""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": _ROLES.get(message.type, "user"), "content": message.content}
+                for message in messages
+            ],
+            "temperature": kwargs.pop('temperature', self.temperature),
+            "max_tokens": kwargs.pop('max_tokens', self.max_tokens),
+            **kwargs
+        }
+        self._check_context_window(messages, payload["max_tokens"])
+        if self.prompt_cache_key:
+            payload.setdefault("prompt_cache_key", self.prompt_cache_key)
+        if stream:
+            payload["stream"] = True
+        return orjson.dumps(payload)
+    
+    def _parse_response(self, data: Dict[str, Any]) -> LLMResponse:
+        """Build an LLMResponse from a Chat Completions response."""
+        choice = data["choices"][0]
+        usage = data.get("usage") or {}
+        
+        return LLMResponse(
+            content=choice["message"].get("content") or "",
+            model=self.model,
+            tokens_used=usage.get("total_tokens"),
+            finish_reason=choice.get("finish_reason"),
+            metadata={"token_usage": usage, "model_name": data.get("model")}
+        )
+    
+    @_retry_transient
     def invoke(
         self,
         messages: List[BaseMessage],
@@ -131,43 +401,49 @@ class OpenAIClient(LLMClient):
         
         Args:
             messages: List of messages
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (temperature/max_tokens override
+                the defaults, anything else is passed to the API)
             
         Returns:
             LLMResponse object
         """
         try:
-            # Override temperature if provided
-            temp = kwargs.pop('temperature', self.temperature)
-            max_tok = kwargs.pop('max_tokens', self.max_tokens)
-            
-            # Create temporary client with custom params if needed
-            if temp != self.temperature or max_tok != self.max_tokens:
-                client = ChatOpenAI(
-                    model=self.model,
-                    temperature=temp,
-                    max_tokens=max_tok,
-                    api_key=self.api_key
-                )
-            else:
-                client = self.client
-            
-            # Invoke
-            response = client.invoke(messages, **kwargs)
+            response = _get_http_client().post(
+                self.API_URL,
+                content=self._build_payload(messages, **kwargs),
+                headers=self.headers
+            )
+            _raise_for_status(response)
+            return self._parse_response(orjson.loads(response.content))
             
-            # Extract token usage if available
-            tokens_used = None
-            if hasattr(response, 'response_metadata'):
-                usage = response.response_metadata.get('token_usage', {})
-                tokens_used = usage.get('total_tokens')
+        except Exception as e:
+            self.logger.error(f"OpenAI invocation error: {str(e)}")
+            raise
+    
+    @_retry_transient
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke OpenAI model asynchronously.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
             
-            return LLMResponse(
-                content=response.content,
-                model=self.model,
-                tokens_used=tokens_used,
-                finish_reason=getattr(response, 'finish_reason', None),
-                metadata=getattr(response, 'response_metadata', {})
+        Returns:
+            LLMResponse object
+        """
+        try:
+            response = await _get_async_http_client().post(
+                self.API_URL,
+                content=self._build_payload(messages, **kwargs),
+                headers=self.headers
             )
+            _raise_for_status(response)
+            return self._parse_response(orjson.loads(response.content))
             
         except Exception as e:
             self.logger.error(f"OpenAI invocation error: {str(e)}")
@@ -189,8 +465,19 @@ class OpenAIClient(LLMClient):
             Response chunks
         """
         try:
-            for chunk in self.client.stream(messages, **kwargs):
-                yield chunk.content
+            with _get_http_client().stream(
+                "POST",
+                self.API_URL,
+                content=self._build_payload(messages, stream=True, **kwargs),
+                headers=self.headers
+            ) as response:
+                _raise_for_status(response)
+                for event in _iter_sse_data(response.iter_bytes()):
+                    if not event.get("choices"):
+                        continue
+                    content = event["choices"][0].get("delta", {}).get("content")
+                    if content:
+                        yield content
                 
         except Exception as e:
             self.logger.error(f"OpenAI streaming error: {str(e)}")
@@ -198,7 +485,10 @@ class OpenAIClient(LLMClient):
 
 
 class AnthropicClient(LLMClient):
-    """Anthropic (Claude) LLM client implementation."""
+    """Anthropic (Claude) LLM client implementation (Messages API over the shared HTTP pool)."""
+    
+    API_URL = "https://api.anthropic.com/v1/messages"
+    API_VERSION = "2023-06-01"
     
     def __init__(
         self,
@@ -224,16 +514,55 @@ class AnthropicClient(LLMClient):
         if not self.api_key:
             raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable.")
         
-        # Initialize LangChain client
-        self.client = ChatAnthropic(
-            model=self.model,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            api_key=self.api_key
-        )
+        self.headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": self.API_VERSION,
+            "content-type": "application/json"
+        }
         
         self.logger.info(f"Anthropic client initialized with model: {self.model}")
     
+    def _build_payload(self, messages: List[BaseMessage], stream: bool = False, **kwargs) -> bytes:
+        """
+        Serialize a Messages API request body.
+        
+        System prompts go top-level as text blocks; the last one is marked
+        ``cache_control: ephemeral`` so the static agent prompt is served
+        from Anthropic's prompt cache instead of being re-prefilled.
+        """
+        system_parts = [message.content for message in messages if message.type == "system"]
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": _ROLES.get(message.type, "user"), "content": message.content}
+                for message in messages
+                if message.type != "system"
+            ],
+            "temperature": kwargs.pop('temperature', self.temperature),
+            "max_tokens": kwargs.pop('max_tokens', self.max_tokens),
+            **kwargs
+        }
+        self._check_context_window(messages, payload["max_tokens"])
+        if system_parts:
+            payload["system"] = [{"type": "text", "text": part} for part in system_parts]
+            payload["system"][-1]["cache_control"] = {"type": "ephemeral"}
+        if stream:
+            payload["stream"] = True
+        return orjson.dumps(payload)
+    
+    def _parse_response(self, data: Dict[str, Any]) -> LLMResponse:
+        """Build an LLMResponse from a Messages API response."""
+        usage = data.get("usage") or {}
+        
+        return LLMResponse(
+            content="".join(block.get("text", "") for block in data.get("content", []) if block.get("type") == "text"),
+            model=self.model,
+            tokens_used=usage.get('input_tokens', 0) + usage.get('output_tokens', 0),
+            finish_reason=data.get("stop_reason"),
+            metadata={"usage": usage, "model_name": data.get("model")}
+        )
+    
+    @_retry_transient
     def invoke(
         self,
         messages: List[BaseMessage],
@@ -244,43 +573,49 @@ class AnthropicClient(LLMClient):
         
         Args:
             messages: List of messages
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (temperature/max_tokens override
+                the defaults, anything else is passed to the API)
             
         Returns:
             LLMResponse object
         """
         try:
-            # Override temperature if provided
-            temp = kwargs.pop('temperature', self.temperature)
-            max_tok = kwargs.pop('max_tokens', self.max_tokens)
-            
-            # Create temporary client with custom params if needed
-            if temp != self.temperature or max_tok != self.max_tokens:
-                client = ChatAnthropic(
-                    model=self.model,
-                    temperature=temp,
-                    max_tokens=max_tok,
-                    api_key=self.api_key
-                )
-            else:
-                client = self.client
-            
-            # Invoke
-            response = client.invoke(messages, **kwargs)
+            response = _get_http_client().post(
+                self.API_URL,
+                content=self._build_payload(messages, **kwargs),
+                headers=self.headers
+            )
+            _raise_for_status(response)
+            return self._parse_response(orjson.loads(response.content))
             
-            # Extract token usage if available
-            tokens_used = None
-            if hasattr(response, 'response_metadata'):
-                usage = response.response_metadata.get('usage', {})
-                tokens_used = usage.get('input_tokens', 0) + usage.get('output_tokens', 0)
+        except Exception as e:
+            self.logger.error(f"Anthropic invocation error: {str(e)}")
+            raise
+    
+    @_retry_transient
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke Anthropic model asynchronously.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
             
-            return LLMResponse(
-                content=response.content,
-                model=self.model,
-                tokens_used=tokens_used,
-                finish_reason=None,
-                metadata=getattr(response, 'response_metadata', {})
+        Returns:
+            LLMResponse object
+        """
+        try:
+            response = await _get_async_http_client().post(
+                self.API_URL,
+                content=self._build_payload(messages, **kwargs),
+                headers=self.headers
             )
+            _raise_for_status(response)
+            return self._parse_response(orjson.loads(response.content))
             
         except Exception as e:
             self.logger.error(f"Anthropic invocation error: {str(e)}")
@@ -302,30 +637,289 @@ class AnthropicClient(LLMClient):
             Response chunks
         """
         try:
-            for chunk in self.client.stream(messages, **kwargs):
-                yield chunk.content
+            with _get_http_client().stream(
+                "POST",
+                self.API_URL,
+                content=self._build_payload(messages, stream=True, **kwargs),
+                headers=self.headers
+            ) as response:
+                _raise_for_status(response)
+                for event in _iter_sse_data(response.iter_bytes()):
+                    if event.get("type") == "content_block_delta":
+                        text = event.get("delta", {}).get("text")
+                        if text:
+                            yield text
+                    elif event.get("type") == "message_stop":
+                        break
                 
         except Exception as e:
             self.logger.error(f"Anthropic streaming error: {str(e)}")
             raise
 
 
+class VLLMClient(OpenAIClient):
+    """
+    Self-hosted vLLM client (OpenAI-compatible Chat Completions endpoint).
+    
+    Meant for high-volume offline runs (e.g. evaluating many drafts with the
+    safety and critic agents): vLLM batches concurrent requests on the GPU,
+    so issue them concurrently through ``ainvoke``. Serve with
+    ``--enable-prefix-caching`` so the shared agent system prompts are
+    reused across requests.
+    """
+    
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        api_key: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        base_url: Optional[str] = None
+    ):
+        """
+        Initialize vLLM client.
+        
+        Args:
+            model: Served model name (default from settings)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            api_key: Key passed to ``vllm serve --api-key`` (optional)
+            prompt_cache_key: Ignored; vLLM caches shared prefixes itself
+            base_url: OpenAI-compatible base URL (default from settings)
+        """
+        LLMClient.__init__(self, model or settings.vllm_model, temperature, max_tokens)
+        
+        self.API_URL = f"{(base_url or settings.vllm_url).rstrip('/')}/chat/completions"
+        self.api_key = api_key or settings.vllm_api_key
+        self.prompt_cache_key = None
+        
+        self.headers = {"content-type": "application/json"}
+        if self.api_key:
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        self.logger.info(f"vLLM client initialized with model: {self.model} at {self.API_URL}")
+
+
+class CachedLLMClient(LLMClient):
+    """
+    LLM client wrapper that reuses responses for identical requests.
+    
+    Requests are keyed by a hash of the namespace, provider, model,
+    sampling parameters and message contents, so repeated prompts across
+    retries and revision loops skip the network round-trip. Cached
+    responses carry ``metadata["cache_hit"] = True``. Identical async
+    requests that arrive while one is still in flight share its result.
+    """
+    
+    def __init__(
+        self,
+        client: LLMClient,
+        namespace: str = "",
+        max_size: int = 4096
+    ):
+        """
+        Initialize the caching wrapper.
+        
+        Args:
+            client: Client to delegate cache misses to
+            namespace: Cache scope (e.g. agent name) to keep agents apart
+            max_size: Maximum number of cached responses
+        """
+        super().__init__(client.model, client.temperature, client.max_tokens)
+        self.client = client
+        self.namespace = namespace
+        self.max_size = max_size
+        self._cache: Dict[bytes, LLMResponse] = {}
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+        # Agents are process-wide singletons whose sync invoke runs on
+        # LangGraph worker threads, so cache reads/writes are serialized
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _cache_key(
+        self,
+        messages: List[BaseMessage],
+        temperature: float,
+        max_tokens: int
+    ) -> bytes:
+        """
+        Hash the request into a cache key.
+        
+        Message contents are fed to the hasher one by one (with separator
+        bytes) rather than serialized into one large intermediate string.
+        Uses blake3 when installed, blake2b otherwise.
+        """
+        hasher = blake3.blake3() if HAS_BLAKE3 else hashlib.blake2b(digest_size=16)
+        hasher.update(f"{self.namespace}\x00{type(self.client).__name__}\x00{self.model}\x00".encode())
+        hasher.update(struct.pack("<dI", temperature, max_tokens))
+        for message in messages:
+            hasher.update(message.type.encode())
+            hasher.update(b"\x00")
+            hasher.update(message.content.encode())
+            hasher.update(b"\x01")
+        return hasher.digest()
+    
+    def invoke(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke the wrapped client, answering repeated requests from cache.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments (anything beyond temperature and
+                max_tokens bypasses the cache)
+            
+        Returns:
+            LLMResponse object
+        """
+        key, cached = self._lookup(messages, kwargs)
+        if cached is not None:
+            return cached
+        
+        response = self.client.invoke(messages, **kwargs)
+        return self._store(key, response)
+    
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Invoke the wrapped client asynchronously, answering repeated requests from cache.
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
+            
+        Returns:
+            LLMResponse object
+        """
+        key, cached = self._lookup(messages, kwargs)
+        if cached is not None:
+            return cached
+        
+        if key is None:
+            response = await self.client.ainvoke(messages, **kwargs)
+            return self._store(key, response)
+        
+        # Coalesce identical in-flight requests into one upstream call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, messages, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one caller cancelling doesn't abort the call for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch(
+        self,
+        key: bytes,
+        messages: List[BaseMessage],
+        kwargs: Dict[str, Any]
+    ) -> LLMResponse:
+        """Run a cache miss against the wrapped client and store the result."""
+        response = await self.client.ainvoke(messages, **kwargs)
+        return self._store(key, response)
+    
+    def _lookup(
+        self,
+        messages: List[BaseMessage],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[bytes], Optional[LLMResponse]]:
+        """
+        Look a request up in the cache.
+        
+        Returns:
+            (cache key, cached response); the key is None if the request
+            carries extra arguments and must not be cached
+        """
+        if set(kwargs) - {'temperature', 'max_tokens'}:
+            return None, None
+        
+        key = self._cache_key(
+            messages,
+            kwargs.get('temperature', self.temperature),
+            kwargs.get('max_tokens', self.max_tokens)
+        )
+        with self._lock:
+            cached = self._cache.pop(key, None)
+            if cached is None:
+                self.misses += 1
+                return key, None
+            
+            self.hits += 1
+            # Re-insert to refresh recency
+            self._cache[key] = cached
+        
+        return key, replace(cached, metadata={**(cached.metadata or {}), "cache_hit": True})
+    
+    def _store(self, key: Optional[bytes], response: LLMResponse) -> LLMResponse:
+        """Cache a fresh response and mark it as a miss."""
+        if key is not None:
+            with self._lock:
+                if key not in self._cache and len(self._cache) >= self.max_size:
+                    # Evict the least recently used response
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[key] = response
+        
+        return replace(response, metadata={**(response.metadata or {}), "cache_hit": False})
+    
+    def stream(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ):
+        """
+        Stream responses from the wrapped client (not cached).
+        
+        Args:
+            messages: List of messages
+            **kwargs: Additional arguments
+            
+        Yields:
+            Response chunks
+        """
+        yield from self.client.stream(messages, **kwargs)
+    
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+
 # Client Factory
 
+# Provider name -> client class (register new backends here)
+_PROVIDERS: Dict[str, type[LLMClient]] = {
+    "openai": OpenAIClient,
+    "anthropic": AnthropicClient,
+    "vllm": VLLMClient,
+}
+
+
 def get_llm_client(
-    provider: Optional[Literal["openai", "anthropic"]] = None,
+    provider: Optional[str] = None,
     model: Optional[str] = None,
     temperature: float = 0.7,
-    max_tokens: int = 2000
+    max_tokens: int = 2000,
+    cache_namespace: Optional[str] = None
 ) -> LLMClient:
     """
     Get an LLM client based on provider.
     
     Args:
-        provider: LLM provider (defaults to settings)
+        provider: LLM provider, a key of ``_PROVIDERS`` (defaults to settings)
         model: Model identifier (defaults to settings)
         temperature: Sampling temperature
         max_tokens: Maximum tokens in response
+        cache_namespace: If set, wrap the client in a CachedLLMClient
+            scoped to this namespace (also used as the OpenAI prompt cache key)
         
     Returns:
         LLMClient instance
@@ -335,24 +929,41 @@ def get_llm_client(
     """
     provider = provider or settings.primary_llm_provider
     
-    if provider == "openai":
-        return OpenAIClient(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-    elif provider == "anthropic":
-        return AnthropicClient(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-    else:
+    client_cls = _PROVIDERS.get(provider)
+    if client_cls is None:
         raise ValueError(f"Unsupported LLM provider: {provider}")
+    
+    client_kwargs = {"model": model, "temperature": temperature, "max_tokens": max_tokens}
+    if cache_namespace and issubclass(client_cls, OpenAIClient):
+        client_kwargs["prompt_cache_key"] = f"cerina:{cache_namespace}:{get_prompt_version()}"
+    
+    client = client_cls(**client_kwargs)
+    
+    if cache_namespace is not None:
+        return CachedLLMClient(client, namespace=cache_namespace)
+    
+    return client
 
 
 # Token Counting Utilities
 
+# Model names -> tiktoken encoding
+_ENCODING_MAP = {
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-3.5-turbo": "cl100k_base",
+    "claude": "cl100k_base",  # Approximation
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once (BPE tables are parsed on first load)."""
+    import tiktoken
+    
+    return tiktoken.get_encoding(encoding_name)
+
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     Count tokens in text for a given model.
@@ -365,27 +976,46 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
         Token count
     """
     try:
-        # Map model names to encoding
-        encoding_map = {
-            "gpt-4": "cl100k_base",
-            "gpt-4-turbo": "cl100k_base",
-            "gpt-3.5-turbo": "cl100k_base",
-            "claude": "cl100k_base",  # Approximation
-        }
+        encoding = _get_encoding(_ENCODING_MAP.get(model, "cl100k_base"))
+        return len(encoding.encode(text))
         
-        # Get encoding name
-        encoding_name = encoding_map.get(model, "cl100k_base")
-        
-        # Get encoding
-        encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"Token counting failed: {str(e)}. Returning character count / 4 as approximation.")
+        return len(text) // 4
+
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> List[int]:
+    """
+    Count tokens for several texts at once.
+    
+    tiktoken encodes the batch in parallel native threads, which is much
+    faster than calling count_tokens in a loop for multi-message prompts.
+    
+    Args:
+        texts: Texts to count tokens for
+        model: Model identifier
         
-        # Count tokens
-        tokens = encoding.encode(text)
-        return len(tokens)
+    Returns:
+        Token counts in the order of ``texts``
+    """
+    try:
+        encoding = _get_encoding(_ENCODING_MAP.get(model, "cl100k_base"))
+        return [len(tokens) for tokens in encoding.encode_batch(texts, num_threads=os.cpu_count() or 1)]
         
     except Exception as e:
         logger.warning(f"Token counting failed: {str(e)}. Returning character count / 4 as approximation.")
-        return len(text) // 4
+        return [len(text) // 4 for text in texts]
+
+
+# Pricing as of December 2024 (approximate): model -> (input, output) USD per token
+_PRICING: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    "gpt-4-turbo": (0.01 / 1000, 0.03 / 1000),   # $0.01 / $0.03 per 1K tokens
+    "gpt-4": (0.03 / 1000, 0.06 / 1000),
+    "gpt-3.5-turbo": (0.0005 / 1000, 0.0015 / 1000),
+    "claude-3-5-sonnet": (0.003 / 1000, 0.015 / 1000),
+    "claude-3-opus": (0.015 / 1000, 0.075 / 1000),
+})
+_DEFAULT_PRICING = _PRICING["gpt-4-turbo"]
 
 
 def estimate_cost(
@@ -404,56 +1034,37 @@ def estimate_cost(
     Returns:
         Estimated cost in USD
     """
-    # Pricing as of December 2024 (approximate)
-    pricing = {
-        "gpt-4-turbo": {
-            "input": 0.01 / 1000,   # $0.01 per 1K input tokens
-            "output": 0.03 / 1000,  # $0.03 per 1K output tokens
-        },
-        "gpt-4": {
-            "input": 0.03 / 1000,
-            "output": 0.06 / 1000,
-        },
-        "gpt-3.5-turbo": {
-            "input": 0.0005 / 1000,
-            "output": 0.0015 / 1000,
-        },
-        "claude-3-5-sonnet": {
-            "input": 0.003 / 1000,
-            "output": 0.015 / 1000,
-        },
-        "claude-3-opus": {
-            "input": 0.015 / 1000,
-            "output": 0.075 / 1000,
-        },
-    }
-    
-    # Get pricing for model
-    model_pricing = pricing.get(model, pricing["gpt-4-turbo"])
-    
-    # Calculate cost
-    input_cost = input_tokens * model_pricing["input"]
-    output_cost = output_tokens * model_pricing["output"]
-    
-    return input_cost + output_cost
+    input_rate, output_rate = _PRICING.get(model, _DEFAULT_PRICING)
+    return input_tokens * input_rate + output_tokens * output_rate
 
 
 # Usage tracking
 
+@dataclass(slots=True)
+class AgentStats:
+    """Per-agent token usage counters."""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    requests: int = 0
+
+
 class TokenUsageTracker:
-    """Track token usage across requests."""
+    """Track token usage across requests (safe to share between threads)."""
     
     def __init__(self):
+        self._lock = threading.Lock()
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_requests = 0
-        self.requests_by_agent = {}
+        self.cache_hits = 0
+        self.requests_by_agent: Dict[str, AgentStats] = defaultdict(AgentStats)
     
     def record_usage(
         self,
         agent: str,
         input_tokens: int,
-        output_tokens: int
+        output_tokens: int,
+        cache_hit: bool = False
     ):
         """
         Record token usage for an agent.
@@ -462,21 +1073,21 @@ class TokenUsageTracker:
             agent: Agent identifier
             input_tokens: Input tokens used
             output_tokens: Output tokens used
+            cache_hit: Response was served from cache (no tokens billed)
         """
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_requests += 1
-        
-        if agent not in self.requests_by_agent:
-            self.requests_by_agent[agent] = {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "requests": 0
-            }
-        
-        self.requests_by_agent[agent]["input_tokens"] += input_tokens
-        self.requests_by_agent[agent]["output_tokens"] += output_tokens
-        self.requests_by_agent[agent]["requests"] += 1
+        with self._lock:
+            if cache_hit:
+                self.cache_hits += 1
+                return
+            
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_requests += 1
+            
+            stats = self.requests_by_agent[agent]
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.requests += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -485,25 +1096,35 @@ class TokenUsageTracker:
         Returns:
             Dictionary of usage stats
         """
+        with self._lock:
+            total_input_tokens = self.total_input_tokens
+            total_output_tokens = self.total_output_tokens
+            total_requests = self.total_requests
+            cache_hits = self.cache_hits
+            by_agent = {agent: asdict(stats) for agent, stats in self.requests_by_agent.items()}
+        
         return {
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
-            "total_tokens": self.total_input_tokens + self.total_output_tokens,
-            "total_requests": self.total_requests,
-            "by_agent": self.requests_by_agent,
+            "total_input_tokens": total_input_tokens,
+            "total_output_tokens": total_output_tokens,
+            "total_tokens": total_input_tokens + total_output_tokens,
+            "total_requests": total_requests,
+            "cache_hits": cache_hits,
+            "by_agent": by_agent,
             "estimated_cost": estimate_cost(
-                self.total_input_tokens,
-                self.total_output_tokens,
+                total_input_tokens,
+                total_output_tokens,
                 settings.openai_model if settings.primary_llm_provider == "openai" else settings.anthropic_model
             )
         }
     
     def reset(self):
         """Reset all counters."""
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.total_requests = 0
-        self.requests_by_agent = {}
+        with self._lock:
+            self.total_input_tokens = 0
+            self.total_output_tokens = 0
+            self.total_requests = 0
+            self.cache_hits = 0
+            self.requests_by_agent = defaultdict(AgentStats)
 
 
 # Global tracker instance
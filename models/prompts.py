@@ -4,7 +4,12 @@ Prompt templates for all agents.
 Contains system prompts and user prompt generators for each agent.
 """
 
-from typing import Optional
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Mapping, Optional
+
+if TYPE_CHECKING:
+    from state.protocol_state import CriticFeedback, SafetyFlag, SupervisorDecision
 
 
 # ============================================================================
@@ -102,27 +107,10 @@ Emergency contacts: [Crisis line, therapist contact]
 
 Generate content that is clinically sound, compassionate, and practically useful."""
 
-def get_drafter_user_prompt(
-    user_intent: str,
-    current_draft: Optional[str] = None,
-    feedback_context: Optional[str] = None,
-    iteration: int = 0
-) -> str:
-    """
-    Generate user prompt for drafter agent.
-    
-    Args:
-        user_intent: User's clinical need
-        current_draft: Previous draft (if revision)
-        feedback_context: Feedback from other agents
-        iteration: Current iteration number
-        
-    Returns:
-        Formatted user prompt
-    """
-    if iteration == 0:
-        # First draft
-        return f"""Create a comprehensive CBT exercise for the following patient need:
+
+# Static scaffolding is built (and interned) once at import; each call only
+# substitutes the variable slots via format_map.
+_DRAFTER_FIRST_TPL = sys.intern("""Create a comprehensive CBT exercise for the following patient need:
 
 **Patient Intent:** {user_intent}
 
@@ -135,32 +123,66 @@ Include all required sections:
 - Homework Assignments
 - Safety Considerations
 
-Make it practical, empathetic, and evidence-based. Use clear headers and well-organized formatting."""
-    
-    else:
-        # Revision
-        prompt = f"""Revise the following CBT exercise based on feedback:
+Make it practical, empathetic, and evidence-based. Use clear headers and well-organized formatting.""")
+
+_DRAFTER_REVISION_TPL = sys.intern("""Revise the following CBT exercise based on feedback:
 
 **Patient Intent:** {user_intent}
 
 **Previous Draft:**
 {current_draft}
-"""
-        
-        if feedback_context:
-            prompt += f"""
+
+
+Please generate an improved version that addresses all the feedback while maintaining clinical quality and empathy.
+
+Ensure all required sections are present and properly structured.""")
+
+_DRAFTER_REVISION_WITH_FEEDBACK_TPL = sys.intern("""Revise the following CBT exercise based on feedback:
+
+**Patient Intent:** {user_intent}
+
+**Previous Draft:**
+{current_draft}
+
 
 **Feedback to Address:**
 {feedback_context}
-"""
-        
-        prompt += """
+
 
 Please generate an improved version that addresses all the feedback while maintaining clinical quality and empathy.
 
-Ensure all required sections are present and properly structured."""
+Ensure all required sections are present and properly structured.""")
+
+
+def get_drafter_user_prompt(
+    user_intent: str,
+    current_draft: Optional[str] = None,
+    feedback_context: Optional[str] = None,
+    iteration: int = 0
+) -> str:
+    """
+    Generate user prompt for drafter agent.
+    
+    Args:
+        user_intent: User's clinical need
+        current_draft: Previous draft (if revision)
+        feedback_context: Feedback from other agents
+        iteration: Current iteration number
         
-        return prompt
+    Returns:
+        Formatted user prompt
+    """
+    if iteration == 0:
+        # First draft
+        return _DRAFTER_FIRST_TPL.format_map({"user_intent": user_intent})
+    
+    # Revision
+    values = {"user_intent": user_intent, "current_draft": current_draft}
+    if feedback_context:
+        values["feedback_context"] = feedback_context
+        return _DRAFTER_REVISION_WITH_FEEDBACK_TPL.format_map(values)
+    
+    return _DRAFTER_REVISION_TPL.format_map(values)
 
 
 # ============================================================================
@@ -261,18 +283,7 @@ Confidence: 0.85
 You are a safety guardian, not a blocker. Help create the safest possible therapeutic content."""
 
 
-def get_safety_user_prompt(user_intent: str, draft: str) -> str:
-    """
-    Generate user prompt for safety guardian agent.
-    
-    Args:
-        user_intent: Original user intent
-        draft: Current protocol draft
-        
-    Returns:
-        Formatted user prompt
-    """
-    return f"""Analyze the following CBT protocol for safety concerns:
+_SAFETY_USER_TPL = sys.intern("""Analyze the following CBT protocol for safety concerns:
 
 **Original Intent:** {user_intent}
 
@@ -290,7 +301,21 @@ Focus on:
 6. Liability concerns
 7. Cultural and ethical issues
 
-Be specific about any concerns and provide actionable recommendations."""
+Be specific about any concerns and provide actionable recommendations.""")
+
+
+def get_safety_user_prompt(user_intent: str, draft: str) -> str:
+    """
+    Generate user prompt for safety guardian agent.
+    
+    Args:
+        user_intent: Original user intent
+        draft: Current protocol draft
+        
+    Returns:
+        Formatted user prompt
+    """
+    return _SAFETY_USER_TPL.format_map({"user_intent": user_intent, "draft": draft})
 
 
 # ============================================================================
@@ -403,18 +428,7 @@ Confidence: 0.XX
 Be constructive and specific. Focus on actionable feedback that improves therapeutic value."""
 
 
-def get_critic_user_prompt(user_intent: str, draft: str) -> str:
-    """
-    Generate user prompt for clinical critic agent.
-    
-    Args:
-        user_intent: Original user intent
-        draft: Current protocol draft
-        
-    Returns:
-        Formatted user prompt
-    """
-    return f"""Evaluate the following CBT protocol for clinical quality and therapeutic effectiveness:
+_CRITIC_USER_TPL = sys.intern("""Evaluate the following CBT protocol for clinical quality and therapeutic effectiveness:
 
 **Original Intent:** {user_intent}
 
@@ -431,7 +445,21 @@ Rate each of the 6 criteria (0-10) and provide:
 5. Empathy score (0.0-1.0)
 6. Overall recommendation (APPROVE / REQUEST_MINOR_REVISIONS / REQUEST_MAJOR_REVISIONS)
 
-Be specific and actionable in your feedback."""
+Be specific and actionable in your feedback.""")
+
+
+def get_critic_user_prompt(user_intent: str, draft: str) -> str:
+    """
+    Generate user prompt for clinical critic agent.
+    
+    Args:
+        user_intent: Original user intent
+        draft: Current protocol draft
+        
+    Returns:
+        Formatted user prompt
+    """
+    return _CRITIC_USER_TPL.format_map({"user_intent": user_intent, "draft": draft})
 
 
 # ============================================================================
@@ -494,17 +522,17 @@ This is a rule-based supervisor - no LLM calls needed."""
 # ============================================================================
 
 def format_feedback_context(
-    safety_flags: list,
-    critic_feedback: list,
-    supervisor_decisions: list
+    safety_flags: List["SafetyFlag"],
+    critic_feedback: List["CriticFeedback"],
+    supervisor_decisions: List["SupervisorDecision"]
 ) -> str:
     """
     Format agent feedback into context string for drafter.
     
     Args:
-        safety_flags: List of safety flag objects
-        critic_feedback: List of critic feedback objects
-        supervisor_decisions: List of supervisor decisions
+        safety_flags: Safety flags recorded on the state
+        critic_feedback: Critic feedback entries recorded on the state
+        supervisor_decisions: Supervisor decisions recorded on the state
         
     Returns:
         Formatted context string
@@ -514,24 +542,23 @@ def format_feedback_context(
     # Safety concerns
     if safety_flags:
         context_parts.append("**Safety Concerns:**")
-        for flag in safety_flags[-3:]:  # Last 3
-            severity = getattr(flag, 'severity', 'UNKNOWN')
-            issue = getattr(flag, 'issue', 'Unknown issue')
-            rec = getattr(flag, 'recommendation', 'Review and revise')
-            context_parts.append(f"- [{severity}] {issue}")
-            context_parts.append(f"  → Recommendation: {rec}")
+        context_parts.extend(
+            f"- [{flag.severity}] {flag.issue}\n  → Recommendation: {flag.recommendation}"
+            for flag in safety_flags[-3:]  # Last 3
+        )
     
     # Quality feedback
     if critic_feedback:
         context_parts.append("\n**Quality Feedback:**")
-        latest = critic_feedback[-1]
-        improvements = getattr(latest, 'improvements', [])
-        for improvement in improvements[:5]:  # Top 5
-            context_parts.append(f"- {improvement}")
+        # Top 5 improvements from the latest feedback
+        context_parts.extend(f"- {improvement}" for improvement in critic_feedback[-1].improvements[:5])
     
     return "\n".join(context_parts) if context_parts else ""
 
 
+_PROMPT_VERSION = "1.0.0"
+
+
 def get_prompt_version() -> str:
     """
     Return the current prompt version for tracking.
@@ -539,32 +566,36 @@ def get_prompt_version() -> str:
     Returns:
         Version string
     """
-    return "1.0.0"
-
-
-def get_all_prompts() -> dict:
+    return _PROMPT_VERSION
+
+
+# Prompts are static, so the catalogue is built once (read-only views)
+_ALL_PROMPTS: Mapping[str, object] = MappingProxyType({
+    "drafter": MappingProxyType({
+        "system": DRAFTER_SYSTEM_PROMPT,
+        "user_generator": get_drafter_user_prompt.__doc__
+    }),
+    "safety_guardian": MappingProxyType({
+        "system": SAFETY_GUARDIAN_SYSTEM_PROMPT,
+        "user_generator": get_safety_user_prompt.__doc__
+    }),
+    "clinical_critic": MappingProxyType({
+        "system": CLINICAL_CRITIC_SYSTEM_PROMPT,
+        "user_generator": get_critic_user_prompt.__doc__
+    }),
+    "supervisor": MappingProxyType({
+        "system": SUPERVISOR_SYSTEM_PROMPT,
+        "user_generator": "No user prompt - rule-based"
+    }),
+    "version": _PROMPT_VERSION
+})
+
+
+def get_all_prompts() -> Mapping[str, object]:
     """
-    Get all prompts as a dictionary (useful for documentation/testing).
+    Get all prompts as a read-only mapping (useful for documentation/testing).
     
     Returns:
-        Dictionary of all prompts
+        Mapping of all prompts
     """
-    return {
-        "drafter": {
-            "system": DRAFTER_SYSTEM_PROMPT,
-            "user_generator": get_drafter_user_prompt.__doc__
-        },
-        "safety_guardian": {
-            "system": SAFETY_GUARDIAN_SYSTEM_PROMPT,
-            "user_generator": get_safety_user_prompt.__doc__
-        },
-        "clinical_critic": {
-            "system": CLINICAL_CRITIC_SYSTEM_PROMPT,
-            "user_generator": get_critic_user_prompt.__doc__
-        },
-        "supervisor": {
-            "system": SUPERVISOR_SYSTEM_PROMPT,
-            "user_generator": "No user prompt - rule-based"
-        },
-        "version": get_prompt_version()
-    }
\ No newline at end of file
+    return _ALL_PROMPTS
\ No newline at end of file
@@ -12,7 +12,8 @@ from .protocol_state import (
     SafetyFlag,
     CriticFeedback,
     SupervisorDecision,
-    MetadataScores
+    MetadataScores,
+    metadata_to_json
 )
 from .schemas import (
     GenerationRequest,
@@ -32,6 +33,7 @@ __all__ = [
     "CriticFeedback",
     "SupervisorDecision",
     "MetadataScores",
+    "metadata_to_json",
     # API schemas
     "GenerationRequest",
     "GenerationResponse",
@@ -7,7 +7,9 @@ read and write to shared state throughout the workflow.
 
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass
+from pydantic import BaseModel, Field, model_validator
+import orjson
 from enum import Enum
 
 
@@ -28,6 +30,26 @@ class SafetySeverity(str, Enum):
     LOW = "low"
 
 
+# Numeric rank per severity, used for the denormalized max-severity scalar
+SEVERITY_RANK: Dict[str, int] = {
+    SafetySeverity.LOW.value: 1,
+    SafetySeverity.MEDIUM.value: 2,
+    SafetySeverity.HIGH.value: 3,
+}
+
+# Plain-string severity constants for hot comparisons (fields store enum
+# values as str, so this skips the Enum member lookup on every check)
+HIGH_SEVERITY: str = SafetySeverity.HIGH.value
+HIGH_SEVERITY_RANK: int = SEVERITY_RANK[HIGH_SEVERITY]
+
+# Safety score penalty per flag severity
+SEVERITY_PENALTY: Dict[str, float] = {
+    SafetySeverity.LOW.value: 0.05,
+    SafetySeverity.MEDIUM.value: 0.15,
+    SafetySeverity.HIGH.value: 0.3,
+}
+
+
 class AgentRole(str, Enum):
     """Agent roles in the system."""
     DRAFTER = "drafter"
@@ -44,6 +66,15 @@ class ScratchpadEntry(BaseModel):
     iteration: int
     agent: AgentRole
     entry_type: str
+    
+    # Entries are append-only value objects: immutable once recorded, no
+    # unknown keys, and enums stored as their plain string values
+    model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "validate_assignment": False,
+        "use_enum_values": True,
+    }
 
 
 class SafetyFlag(ScratchpadEntry):
@@ -53,8 +84,6 @@ class SafetyFlag(ScratchpadEntry):
     issue: str
     recommendation: str
     confidence: float = Field(ge=0.0, le=1.0)
-    
-    model_config = {"use_enum_values": True}
 
 
 class CriticFeedback(ScratchpadEntry):
@@ -102,14 +131,39 @@ class DraftVersion(BaseModel):
 
 # Metadata and Scoring
 
-class MetadataScores(BaseModel):
-    """Aggregated scores and metrics for the protocol."""
-    safety_score: float = Field(default=1.0, ge=0.0, le=1.0, description="Overall safety (1.0 = perfectly safe)")
-    empathy_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Empathy and tone quality")
-    clinical_accuracy_score: float = Field(default=0.0, ge=0.0, le=10.0, description="Clinical accuracy (0-10)")
-    clarity_score: float = Field(default=0.0, ge=0.0, le=10.0, description="Clarity and accessibility")
-    completeness_score: float = Field(default=0.0, ge=0.0, le=10.0, description="Completeness of content")
-    overall_quality_score: float = Field(default=0.0, ge=0.0, le=10.0, description="Overall quality rating")
+# (field, lower bound, upper bound) for every MetadataScores field
+_SCORE_BOUNDS = (
+    ("safety_score", 0.0, 1.0),
+    ("empathy_score", 0.0, 1.0),
+    ("clinical_accuracy_score", 0.0, 10.0),
+    ("clarity_score", 0.0, 10.0),
+    ("completeness_score", 0.0, 10.0),
+    ("overall_quality_score", 0.0, 10.0),
+)
+
+
+@dataclass(slots=True)
+class MetadataScores:
+    """
+    Aggregated scores and metrics for the protocol.
+    
+    A slotted dataclass rather than a BaseModel: it is a flat record of
+    floats that is read and rebuilt on every state write and API response.
+    Pydantic still validates it as a field of ProtocolState and the API
+    schemas (``__post_init__`` enforces the ranges).
+    """
+    safety_score: float = 1.0            # Overall safety (1.0 = perfectly safe)
+    empathy_score: float = 0.0           # Empathy and tone quality
+    clinical_accuracy_score: float = 0.0 # Clinical accuracy (0-10)
+    clarity_score: float = 0.0           # Clarity and accessibility
+    completeness_score: float = 0.0      # Completeness of content
+    overall_quality_score: float = 0.0   # Overall quality rating
+    
+    def __post_init__(self):
+        for name, low, high in _SCORE_BOUNDS:
+            value = getattr(self, name)
+            if not low <= value <= high:
+                raise ValueError(f"{name} must be between {low} and {high}, got {value}")
     
     def update_from_critic(self, critic_feedback: CriticFeedback):
         """Update scores based on critic feedback."""
@@ -124,23 +178,44 @@ class MetadataScores(BaseModel):
     
     def update_from_safety(self, safety_flags: List[SafetyFlag]):
         """Update safety score based on safety flags."""
-        if not safety_flags:
-            self.safety_score = 1.0
-            return
-        
-        # Reduce score based on severity
+        # Reduce score based on severity (lookup bound once outside the loop)
+        penalty_for = SEVERITY_PENALTY.get
         penalty = 0.0
         for flag in safety_flags:
-            if flag.severity == SafetySeverity.HIGH:
-                penalty += 0.3
-            elif flag.severity == SafetySeverity.MEDIUM:
-                penalty += 0.15
-            elif flag.severity == SafetySeverity.LOW:
-                penalty += 0.05
-        
+            penalty += penalty_for(flag.severity, 0.0)
         self.safety_score = max(0.0, 1.0 - penalty)
 
 
+def metadata_to_json(metadata: MetadataScores) -> bytes:
+    """
+    Encode metadata scores as JSON with explicit field reads.
+    
+    Args:
+        metadata: Scores to encode
+        
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps({
+        "safety_score": metadata.safety_score,
+        "empathy_score": metadata.empathy_score,
+        "clinical_accuracy_score": metadata.clinical_accuracy_score,
+        "clarity_score": metadata.clarity_score,
+        "completeness_score": metadata.completeness_score,
+        "overall_quality_score": metadata.overall_quality_score,
+    })
+
+
+# Entry counter field -> the list it counts (see ProtocolState)
+_ENTRY_COUNTERS: Dict[str, str] = {
+    "draft_count": "draft_versions",
+    "safety_flag_count": "safety_flags",
+    "critic_feedback_count": "critic_feedbacks",
+    "supervisor_decision_count": "supervisor_decisions",
+    "drafter_note_count": "drafter_notes",
+}
+
+
 # Main Protocol State (The "Blackboard")
 
 class ProtocolState(BaseModel):
@@ -167,27 +242,58 @@ class ProtocolState(BaseModel):
     # Iteration Tracking
     iteration_count: int = Field(default=0)
     max_iterations: int = Field(default=5)
-    
-    # The Scratchpad
-    scratchpad: Dict[str, List[Any]] = Field(
-        default_factory=lambda: {
-            "drafter_notes": [],
-            "safety_flags": [],
-            "safety_checks": [],
-            "critic_feedback": [],
-            "supervisor_decisions": [],
-        }
+    last_agent_run: Optional[str] = Field(
+        default=None,
+        description="Name of the last worker node that ran (used for deterministic routing)"
     )
     
+    # The Scratchpad (free-form records only; typed entries live in the
+    # lists below and are merged in by to_scratchpad_dict). Keys are created
+    # on first write via scratchpad.setdefault(key, []).
+    scratchpad: Dict[str, List[Any]] = Field(default_factory=dict)
+    
     # Structured Agent Outputs
     safety_flags: List[SafetyFlag] = Field(default_factory=list)
     critic_feedbacks: List[CriticFeedback] = Field(default_factory=list)
     supervisor_decisions: List[SupervisorDecision] = Field(default_factory=list)
     drafter_notes: List[DrafterNote] = Field(default_factory=list)
     
+    # Entry counters (incremented by the add_* helpers alongside the lists)
+    draft_count: int = Field(default=0)
+    safety_flag_count: int = Field(default=0)
+    critic_feedback_count: int = Field(default=0)
+    supervisor_decision_count: int = Field(default=0)
+    drafter_note_count: int = Field(default=0)
+    
     # Metadata and Scoring
     metadata: MetadataScores = Field(default_factory=MetadataScores)
     
+    # Denormalized routing scalars (kept in sync by the add_* helpers)
+    latest_quality_score: float = Field(
+        default=0.0,
+        description="Overall critic score of the current draft (0 until it is reviewed)"
+    )
+    recent_max_severity: int = Field(
+        default=0,
+        description="Highest SEVERITY_RANK among safety flags raised on the current draft"
+    )
+    safety_reviewed_draft: int = Field(
+        default=0,
+        description="draft_count of the draft the latest safety review covered"
+    )
+    quality_reviewed_draft: int = Field(
+        default=0,
+        description="draft_count of the draft the latest critic review covered"
+    )
+    high_flags_current_iteration: int = Field(
+        default=0,
+        description="HIGH severity safety flags raised in the current iteration"
+    )
+    high_flags_previous_iteration: int = Field(
+        default=0,
+        description="HIGH severity safety flags raised in the previous iteration"
+    )
+    
     # Human-in-Loop State
     halted_at_iteration: Optional[int] = Field(default=None)
     approval_status: ApprovalStatus = Field(default=ApprovalStatus.PENDING)
@@ -216,9 +322,62 @@ class ProtocolState(BaseModel):
     
     model_config = {"use_enum_values": True}
     
+    @model_validator(mode="after")
+    def _rebuild_entry_counters(self) -> "ProtocolState":
+        """Count the entry lists for counters that were not loaded (older checkpoints)."""
+        fields_set = self.model_fields_set
+        for counter, entries in _ENTRY_COUNTERS.items():
+            if counter not in fields_set:
+                setattr(self, counter, len(getattr(self, entries)))
+        return self
+    
+    @model_validator(mode="after")
+    def _rebuild_safety_scalars(self) -> "ProtocolState":
+        """
+        Derive the safety scalars from safety_flags when they were not loaded.
+        
+        Threads checkpointed before these fields existed would otherwise
+        load them as 0 and report no blocking issues despite HIGH flags.
+        """
+        fields_set = self.model_fields_set
+        if "high_flags_current_iteration" not in fields_set or "high_flags_previous_iteration" not in fields_set:
+            current = previous = 0
+            for flag in self.get_recent_safety_flags():
+                if flag.severity == HIGH_SEVERITY:
+                    if flag.iteration >= self.iteration_count:
+                        current += 1
+                    else:
+                        previous += 1
+            self.high_flags_current_iteration = current
+            self.high_flags_previous_iteration = previous
+        if "recent_max_severity" not in fields_set:
+            # Flags raised since the latest draft was created
+            since = self.draft_versions[-1].created_at if self.draft_versions else None
+            self.recent_max_severity = max(
+                (
+                    SEVERITY_RANK.get(flag.severity, 0)
+                    for flag in self.safety_flags
+                    if since is None or flag.timestamp >= since
+                ),
+                default=0
+            )
+        return self
+    
     # Helper Methods
     
-    def add_draft_version(self, content: str, agent: AgentRole, changes_summary: Optional[str] = None):
+    def _touch(self) -> datetime:
+        """Stamp last_modified with a single clock read and return it for reuse."""
+        now = datetime.now()
+        self.last_modified = now
+        return now
+    
+    def add_draft_version(
+        self,
+        content: str,
+        agent: AgentRole,
+        changes_summary: Optional[str] = None,
+        word_count: Optional[int] = None
+    ):
         """
         Add a new version to the draft history.
         
@@ -226,18 +385,24 @@ class ProtocolState(BaseModel):
             content: Draft content
             agent: Agent that created this version
             changes_summary: Optional summary of changes
+            word_count: Word count if already known (counted here otherwise)
         """
+        now = self._touch()
         version = DraftVersion(
+            created_at=now,
             version_number=len(self.draft_versions) + 1,
             content=content,
             created_by=agent,
-            word_count=len(content.split()),
+            word_count=word_count if word_count is not None else len(content.split()),
             changes_summary=changes_summary,
             iteration=self.iteration_count
         )
         self.draft_versions.append(version)
+        self.draft_count += 1
         self.current_draft = content
-        self.last_modified = datetime.now()
+        # New draft - the previous draft's review results no longer apply
+        self.recent_max_severity = 0
+        self.latest_quality_score = 0.0
     
     def add_safety_flag(
         self,
@@ -255,7 +420,9 @@ class ProtocolState(BaseModel):
             recommendation: Suggested fix
             confidence: Agent's confidence
         """
+        now = self._touch()
         flag = SafetyFlag(
+            timestamp=now,
             iteration=self.iteration_count,
             agent=AgentRole.SAFETY,
             severity=severity,
@@ -264,13 +431,13 @@ class ProtocolState(BaseModel):
             confidence=confidence
         )
         self.safety_flags.append(flag)
-        
-        # Also add to scratchpad for backwards compatibility
-        self.scratchpad["safety_flags"].append(flag.model_dump())
+        self.safety_flag_count += 1
+        self.recent_max_severity = max(self.recent_max_severity, SEVERITY_RANK.get(flag.severity, 0))
+        if flag.severity == HIGH_SEVERITY:
+            self.high_flags_current_iteration += 1
         
         # Update metadata
         self.metadata.update_from_safety(self.safety_flags)
-        self.last_modified = datetime.now()
     
     def add_critic_feedback(
         self,
@@ -296,7 +463,9 @@ class ProtocolState(BaseModel):
             feedback: Detailed feedback text
             confidence: Agent's confidence
         """
+        now = self._touch()
         critic_feedback = CriticFeedback(
+            timestamp=now,
             iteration=self.iteration_count,
             agent=AgentRole.CRITIC,
             overall_score=overall_score,
@@ -309,13 +478,12 @@ class ProtocolState(BaseModel):
             confidence=confidence
         )
         self.critic_feedbacks.append(critic_feedback)
-        
-        # Also add to scratchpad
-        self.scratchpad["critic_feedback"].append(critic_feedback.model_dump())
+        self.critic_feedback_count += 1
+        self.latest_quality_score = critic_feedback.overall_score
+        self.quality_reviewed_draft = self.draft_count
         
         # Update metadata
         self.metadata.update_from_critic(critic_feedback)
-        self.last_modified = datetime.now()
     
     def add_supervisor_decision(
         self,
@@ -331,7 +499,9 @@ class ProtocolState(BaseModel):
             reason: Reasoning
             next_agent: Next agent to run (if applicable)
         """
+        now = self._touch()
         decision = SupervisorDecision(
+            timestamp=now,
             iteration=self.iteration_count,
             agent=AgentRole.SUPERVISOR,
             action=action,
@@ -339,10 +509,7 @@ class ProtocolState(BaseModel):
             next_agent=next_agent
         )
         self.supervisor_decisions.append(decision)
-        
-        # Also add to scratchpad
-        self.scratchpad["supervisor_decisions"].append(decision.model_dump())
-        self.last_modified = datetime.now()
+        self.supervisor_decision_count += 1
     
     def add_drafter_note(
         self,
@@ -360,7 +527,9 @@ class ProtocolState(BaseModel):
             has_structure: Whether draft has proper structure
             addressed_feedback: List of feedback items addressed
         """
+        now = self._touch()
         drafter_note = DrafterNote(
+            timestamp=now,
             iteration=self.iteration_count,
             agent=AgentRole.DRAFTER,
             note=note,
@@ -369,18 +538,14 @@ class ProtocolState(BaseModel):
             addressed_feedback=addressed_feedback or []
         )
         self.drafter_notes.append(drafter_note)
-        
-        # Also add to scratchpad
-        self.scratchpad["drafter_notes"].append(drafter_note.model_dump())
-        self.last_modified = datetime.now()
+        self.drafter_note_count += 1
     
     def halt_for_human_review(self):
         """Mark the state as halted for human review."""
         self.should_halt = True
         self.halted_at_iteration = self.iteration_count
-        self.halted_at = datetime.now()
+        self.halted_at = self._touch()
         self.approval_status = ApprovalStatus.PENDING_HUMAN_REVIEW
-        self.last_modified = datetime.now()
     
     def approve(self, edited_draft: Optional[str] = None):
         """
@@ -398,8 +563,7 @@ class ProtocolState(BaseModel):
             self.approval_status = ApprovalStatus.APPROVED
         
         self.is_finalized = True
-        self.approved_at = datetime.now()
-        self.last_modified = datetime.now()
+        self.approved_at = self._touch()
     
     def reject(self, feedback: str):
         """
@@ -412,12 +576,15 @@ class ProtocolState(BaseModel):
         self.approval_status = ApprovalStatus.REJECTED
         self.needs_revision = True
         self.should_halt = False
-        self.last_modified = datetime.now()
+        self._touch()
     
     def increment_iteration(self):
         """Increment the iteration counter."""
         self.iteration_count += 1
-        self.last_modified = datetime.now()
+        # Slide the blocking-issue window (current and previous iteration)
+        self.high_flags_previous_iteration = self.high_flags_current_iteration
+        self.high_flags_current_iteration = 0
+        self._touch()
     
     def add_error(self, error_type: str, error_message: str, agent: Optional[str] = None):
         """
@@ -428,14 +595,14 @@ class ProtocolState(BaseModel):
             error_message: Error message
             agent: Agent where error occurred
         """
+        now = self._touch()
         self.errors.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,  # Stringified by the serializer at response time
             "iteration": self.iteration_count,
             "error_type": error_type,
             "message": error_message,
             "agent": agent
         })
-        self.last_modified = datetime.now()
     
     def get_latest_safety_assessment(self) -> Optional[SafetyFlag]:
         """Get the most recent safety flag."""
@@ -445,14 +612,36 @@ class ProtocolState(BaseModel):
         """Get the most recent critic feedback."""
         return self.critic_feedbacks[-1] if self.critic_feedbacks else None
     
+    def get_recent_safety_flags(self) -> List[SafetyFlag]:
+        """
+        Get safety flags raised in the current or previous iteration.
+        
+        Flags are appended in iteration order, so this walks back from the
+        end and stops at the first older flag instead of scanning them all.
+        """
+        threshold = self.iteration_count - 1
+        flags = self.safety_flags
+        start = len(flags)
+        while start and flags[start - 1].iteration >= threshold:
+            start -= 1
+        return flags[start:]
+    
+    def mark_safety_reviewed(self):
+        """Record that the safety review of the current draft has completed."""
+        self.safety_reviewed_draft = self.draft_count
+    
+    def is_current_draft_reviewed(self) -> bool:
+        """Check if the current draft has both a safety and a critic result."""
+        return (
+            self.draft_count > 0
+            and self.safety_reviewed_draft == self.draft_count
+            and self.quality_reviewed_draft == self.draft_count
+        )
+    
     def has_blocking_safety_issues(self) -> bool:
         """Check if there are blocking safety issues."""
-        if not self.safety_flags:
-            return False
-        
-        # Check latest safety flags for high severity issues
-        recent_flags = [f for f in self.safety_flags if f.iteration >= self.iteration_count - 1]
-        return any(f.severity == SafetySeverity.HIGH for f in recent_flags)
+        # HIGH severity flags raised in the current or previous iteration
+        return self.high_flags_current_iteration + self.high_flags_previous_iteration > 0
     
     def has_major_quality_issues(self) -> bool:
         """Check if there are major quality issues."""
@@ -475,21 +664,19 @@ class ProtocolState(BaseModel):
         context_parts = []
         
         # Add safety concerns
-        if self.safety_flags:
-            recent_safety = [f for f in self.safety_flags if f.iteration >= self.iteration_count - 1]
-            if recent_safety:
-                context_parts.append("**Safety Concerns:**")
-                for flag in recent_safety:
-                    context_parts.append(f"- [{flag.severity.upper()}] {flag.issue}")
-                    context_parts.append(f"  Recommendation: {flag.recommendation}")
+        recent_safety = self.get_recent_safety_flags()
+        if recent_safety:
+            context_parts.append("**Safety Concerns:**")
+            context_parts.extend(
+                f"- [{flag.severity.upper()}] {flag.issue}\n  Recommendation: {flag.recommendation}"
+                for flag in recent_safety
+            )
         
         # Add quality feedback
-        if self.critic_feedbacks:
-            latest_critic = self.get_latest_critic_feedback()
-            if latest_critic and latest_critic.improvements:
-                context_parts.append("\n**Quality Improvements Needed:**")
-                for improvement in latest_critic.improvements:
-                    context_parts.append(f"- {improvement}")
+        latest_critic = self.get_latest_critic_feedback()
+        if latest_critic and latest_critic.improvements:
+            context_parts.append("\n**Quality Improvements Needed:**")
+            context_parts.extend(f"- {improvement}" for improvement in latest_critic.improvements)
         
         # Add human feedback
         if self.human_feedback:
@@ -497,6 +684,28 @@ class ProtocolState(BaseModel):
         
         return "\n".join(context_parts) if context_parts else ""
     
+    def to_scratchpad_dict(self) -> Dict[str, List[Any]]:
+        """
+        Materialize the full scratchpad for API responses.
+        
+        Typed agent entries are dumped here, once per response, rather than
+        being duplicated into the scratchpad on every write.
+        
+        Returns:
+            Scratchpad dictionary with typed entries as dicts
+        """
+        return {
+            **self.scratchpad,
+            "safety_checks": self.scratchpad.get("safety_checks", []),
+            "drafter_notes": [n.model_dump() for n in self.drafter_notes],
+            "safety_flags": [f.model_dump() for f in self.safety_flags],
+            "critic_feedback": [f.model_dump() for f in self.critic_feedbacks],
+            "supervisor_decisions": (
+                [d.model_dump() for d in self.supervisor_decisions]
+                + self.scratchpad.get("supervisor_decisions", [])
+            ),
+        }
+    
     def to_summary_dict(self) -> Dict[str, Any]:
         """
         Create a summary dictionary for API responses.
@@ -509,7 +718,8 @@ class ProtocolState(BaseModel):
             "user_intent": self.user_intent,
             "iteration_count": self.iteration_count,
             "approval_status": self.approval_status,
-            "metadata": self.metadata.model_dump(),
+            # Flat model of floats: a shallow field copy equals model_dump()
+            "metadata": asdict(self.metadata),
             "has_draft": bool(self.current_draft),
             "safety_flags_count": len(self.safety_flags),
             "is_finalized": self.is_finalized,
@@ -6,7 +6,7 @@ These Pydantic models define the contract between the API and clients.
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .protocol_state import ApprovalStatus, MetadataScores
 
@@ -69,6 +69,10 @@ class GenerationResponse(BaseModel):
     message: str = Field(..., description="Human-readable message")
     user_intent: str = Field(..., description="Original user intent")
     created_at: datetime = Field(..., description="Creation timestamp")
+    state: Optional["StateResponse"] = Field(
+        None,
+        description="Workflow state when the request returned (saves a follow-up /state call)"
+    )
 
 
 class StateResponse(BaseModel):
@@ -185,3 +189,10 @@ class BatchGenerationResponse(BaseModel):
     total: int
     successful: int
     failed: int
+
+
+# Prebuilt serializers for hot responses: dump_json goes straight to bytes
+
+STREAM_EVENT_ADAPTER = TypeAdapter(StreamEvent)
+STATE_RESPONSE_ADAPTER = TypeAdapter(StateResponse)
+DETAILED_STATE_ADAPTER = TypeAdapter(DetailedStateResponse)
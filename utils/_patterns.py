@@ -0,0 +1,50 @@
+"""
+Precompiled regular expressions shared by the helper and validator modules.
+"""
+
+import re
+
+
+# Control characters except newline and tab
+CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+
+UUID4_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
+# Same character set as the original alternation, collapsed into one class:
+# the $-_ range (0x24-0x5F) already spans digits, A-Z, %, &, (, ), *, +, ",",
+# ".", "/", ":", "?", "@" and backslash; add "!" and lowercase letters
+URL_RE = re.compile(r'https?://[!$-_a-z]+')
+
+# A whole markdown header line: optional whitespace, then '#' (the capture
+# group makes split() return the header lines between the section bodies)
+SECTION_HEADER_RE = re.compile(r'^([^\S\n]*#[^\n]*)$', re.MULTILINE)
+
+# ASCII flag keeps IGNORECASE from folding non-ASCII letters (e.g. the
+# Kelvin sign) into [a-z]
+EMAIL_RE = re.compile(
+    r'^[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}$',
+    re.IGNORECASE | re.ASCII
+)
+
+# http(s) URL whose authority is plain ASCII (no IPv6 brackets) and ends at
+# a path/query/fragment delimiter or the end of the string: for these,
+# urlparse is guaranteed to report an http(s) scheme and a non-empty netloc
+SIMPLE_HTTP_URL_RE = re.compile(
+    r"https?://[a-z0-9._~:@!$&'()*+,;=%-]+(?:[/?#]|\Z)",
+    re.IGNORECASE | re.ASCII
+)
+
+# Potentially harmful markup in user input, combined into one alternation.
+# Uses google-re2 (linear-time DFA) when installed, stdlib re otherwise
+_HARMFUL_PATTERN = r'(?i)<script|javascript:|onerror=|onclick='
+
+try:
+    import re2
+    HARMFUL_RE = re2.compile(_HARMFUL_PATTERN)
+    HAS_RE2 = True
+except ImportError:
+    HARMFUL_RE = re.compile(_HARMFUL_PATTERN)
+    HAS_RE2 = False
@@ -2,13 +2,28 @@
 Helper functions for common operations.
 """
 
-import re
 import json
 import hashlib
+from functools import lru_cache
+from itertools import islice
 from uuid import uuid4
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 from datetime import datetime, timedelta
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+from ._patterns import CONTROL_CHARS_RE, SECTION_HEADER_RE, URL_RE, UUID4_RE
+
+
+# Deletion table for the control characters matched by CONTROL_CHARS_RE
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
 
 def generate_thread_id() -> str:
     """
@@ -34,8 +49,12 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     if not text:
         return ""
     
-    # Remove control characters except newline and tab
-    sanitized = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    # Remove control characters except newline and tab. translate() is a
+    # plain C loop for ASCII text but slow on wide strings, where the regex wins
+    if text.isascii():
+        sanitized = text.translate(_CONTROL_CHARS_TABLE)
+    else:
+        sanitized = CONTROL_CHARS_RE.sub('', text)
     
     # Trim whitespace
     sanitized = sanitized.strip()
@@ -62,6 +81,9 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text
     
+    if not suffix:
+        return text[:max_length]
+    
     return text[:max_length - len(suffix)] + suffix
 
 
@@ -78,9 +100,8 @@ def calculate_word_count(text: str) -> int:
     if not text:
         return 0
     
-    # Split on whitespace and filter empty strings
-    words = [word for word in text.split() if word.strip()]
-    return len(words)
+    # str.split() never yields empty or whitespace-only words
+    return len(text.split())
 
 
 def extract_sections(text: str) -> Dict[str, str]:
@@ -93,28 +114,23 @@ def extract_sections(text: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping section names to content
     """
+    parts = SECTION_HEADER_RE.split(text)
+    if len(parts) == 1:
+        return {"introduction": text.strip()}
+    
+    # parts is [preamble, header1, body1, header2, body2, ...]. A section is
+    # kept only if it has at least one line: bodies between two headers
+    # always carry the separating newline, the last one does not
     sections = {}
-    current_section = "introduction"
-    current_content = []
-    
-    lines = text.split('\n')
-    
-    for line in lines:
-        # Check if line is a header (starts with # or ##)
-        if line.strip().startswith('#'):
-            # Save previous section
-            if current_content:
-                sections[current_section] = '\n'.join(current_content).strip()
-            
-            # Start new section
-            current_section = line.strip('#').strip().lower().replace(' ', '_')
-            current_content = []
-        else:
-            current_content.append(line)
-    
-    # Save last section
-    if current_content:
-        sections[current_section] = '\n'.join(current_content).strip()
+    if parts[0]:
+        sections["introduction"] = parts[0].strip()
+    
+    last_header = len(parts) - 2
+    for i in range(1, len(parts), 2):
+        body = parts[i + 1]
+        if body != ("" if i == last_header else "\n"):
+            name = parts[i].strip('#').strip().lower().replace(' ', '_')
+            sections[name] = body.strip()
     
     return sections
 
@@ -143,6 +159,7 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {minutes}m"
 
 
+@lru_cache(maxsize=4096)
 def validate_thread_id(thread_id: str) -> bool:
     """
     Validate thread ID format (UUID4).
@@ -153,11 +170,7 @@ def validate_thread_id(thread_id: str) -> bool:
     Returns:
         True if valid UUID4
     """
-    uuid_pattern = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-        re.IGNORECASE
-    )
-    return bool(uuid_pattern.match(thread_id))
+    return bool(UUID4_RE.match(thread_id))
 
 
 def parse_boolean(value: Any) -> bool:
@@ -182,6 +195,12 @@ def parse_boolean(value: Any) -> bool:
     return False
 
 
+# Characters a document accepted by json.loads can start with (NaN and
+# Infinity are accepted by the stdlib parser), after JSON whitespace
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
 def safe_json_loads(json_str: str, default: Any = None) -> Any:
     """
     Safely parse JSON string with fallback.
@@ -193,26 +212,67 @@ def safe_json_loads(json_str: str, default: Any = None) -> Any:
     Returns:
         Parsed JSON or default value
     """
+    # Cheap reject before paying for a parse attempt and its exception
+    if isinstance(json_str, str):
+        stripped = json_str.lstrip(_JSON_WHITESPACE)
+        if not stripped or stripped[0] not in _JSON_START_CHARS:
+            return default
+    
     try:
         return json.loads(json_str)
     except (json.JSONDecodeError, TypeError, ValueError):
         return default
 
 
-def hash_text(text: str, algorithm: str = "sha256") -> str:
+# Direct constructors for the common algorithms (skips hashlib.new's name lookup)
+_HASH_CONSTRUCTORS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+}
+
+
+@lru_cache(maxsize=2048)
+def hash_text(text: str, algorithm: str = "xxh3") -> str:
     """
     Generate hash of text.
     
+    The default is a fast non-cryptographic 64-bit hash for cache and dedup
+    keys (xxh3 when xxhash is installed, 8-byte blake2b otherwise). Pass a
+    hashlib name explicitly when a cryptographic digest is needed.
+    
     Args:
         text: Text to hash
-        algorithm: Hash algorithm (md5, sha1, sha256)
+        algorithm: Hash algorithm (xxh3, or a hashlib name: md5, sha1, sha256)
         
     Returns:
         Hex digest of hash
     """
-    hasher = hashlib.new(algorithm)
-    hasher.update(text.encode('utf-8'))
-    return hasher.hexdigest()
+    data = text.encode('utf-8')
+    if algorithm == "xxh3":
+        if HAS_XXHASH:
+            return xxhash.xxh3_64_hexdigest(data)
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is not None:
+        return constructor(data).hexdigest()
+    return hashlib.new(algorithm, data).hexdigest()
+
+
+def hash_text_u64(text: str) -> int:
+    """
+    Generate a 64-bit integer hash of text for internal dict keys.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        Unsigned 64-bit hash (no hex conversion)
+    """
+    data = text.encode('utf-8')
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
 
 
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
@@ -226,20 +286,18 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[st
         
     Returns:
         List of text chunks
+        
+    Raises:
+        ValueError: If overlap is not smaller than chunk_size
     """
     if len(text) <= chunk_size:
         return [text]
     
-    chunks = []
-    start = 0
-    
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end]
-        chunks.append(chunk)
-        start = end - overlap
+    step = chunk_size - overlap
+    if step <= 0:
+        raise ValueError("overlap must be smaller than chunk_size")
     
-    return chunks
+    return [text[start:start + chunk_size] for start in range(0, len(text), step)]
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -262,14 +320,13 @@ def calculate_similarity(text1: str, text2: str) -> float:
     words1 = set(text1.lower().split())
     words2 = set(text2.lower().split())
     
-    # Calculate Jaccard similarity
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
-    
-    if not union:
+    if not words1 or not words2:
         return 0.0
     
-    return len(intersection) / len(union)
+    # Jaccard similarity: |A & B| / (|A| + |B| - |A & B|), so the union set
+    # is never built (set intersection already iterates the smaller side)
+    shared = len(words1 & words2)
+    return shared / (len(words1) + len(words2) - shared)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -282,10 +339,7 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs found
     """
-    url_pattern = re.compile(
-        r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    )
-    return url_pattern.findall(text)
+    return URL_RE.findall(text)
 
 
 def format_timestamp(dt: datetime, format_type: str = "iso") -> str:
@@ -309,6 +363,17 @@ def format_timestamp(dt: datetime, format_type: str = "iso") -> str:
         return str(dt)
 
 
+# (upper bound in seconds, unit name, seconds per unit) for time_ago
+_TIME_AGO_UNITS = (
+    (3600, "minute", 60),
+    (86400, "hour", 3600),
+    (604800, "day", 86400),
+    (2592000, "week", 604800),
+    (31536000, "month", 2592000),
+    (None, "year", 31536000),
+)
+
+
 def time_ago(dt: datetime) -> str:
     """
     Convert datetime to human-readable "time ago" format.
@@ -319,31 +384,15 @@ def time_ago(dt: datetime) -> str:
     Returns:
         Human-readable time ago string
     """
-    now = datetime.now()
-    diff = now - dt
-    
-    seconds = diff.total_seconds()
+    seconds = (datetime.now() - dt).total_seconds()
     
     if seconds < 60:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds // 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:
-        days = int(seconds // 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif seconds < 2592000:
-        weeks = int(seconds // 604800)
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    elif seconds < 31536000:
-        months = int(seconds // 2592000)
-        return f"{months} month{'s' if months != 1 else ''} ago"
-    else:
-        years = int(seconds // 31536000)
-        return f"{years} year{'s' if years != 1 else ''} ago"
+    
+    for limit, unit, unit_seconds in _TIME_AGO_UNITS:
+        if limit is None or seconds < limit:
+            count = int(seconds // unit_seconds)
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
 
 
 def batch_items(items: List[Any], batch_size: int) -> List[List[Any]]:
@@ -363,6 +412,25 @@ def batch_items(items: List[Any], batch_size: int) -> List[List[Any]]:
     return batches
 
 
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily batch any iterable into lists of at most batch_size items.
+    
+    Streaming counterpart of batch_items: only one batch is held at a time,
+    so callers that iterate once never materialize the full batch list.
+    
+    Args:
+        items: Items to batch (any iterable, consumed once)
+        batch_size: Size of each batch
+        
+    Yields:
+        Successive batches
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
 def deep_merge(dict1: Dict, dict2: Dict) -> Dict:
     """
     Deep merge two dictionaries.
@@ -376,10 +444,18 @@ def deep_merge(dict1: Dict, dict2: Dict) -> Dict:
     """
     result = dict1.copy()
     
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Iterative with an explicit stack (no recursion limit); a nested dict is
+    # copied only where both sides hold a dict at that key
+    stack = [(result, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
     
     return result
@@ -7,6 +7,7 @@ and human-readable formatting for development.
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -34,20 +35,14 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
-    def format(self, record):
-        """Format log record with colors."""
-        # Add color to level name
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
-        
-        # Format the message
-        result = super().format(record)
-        
-        # Reset levelname for next use
-        record.levelname = levelname
-        
-        return result
+    # Colored level names, built once instead of per record
+    # (class-body comprehensions can't see RESET, so the code is repeated)
+    COLORED_LEVELS = {level: f"{color}{level}\033[0m" for level, color in COLORS.items()}
+    
+    def formatMessage(self, record):
+        """Format log record with colors (the record itself is not mutated)."""
+        levelname = self.COLORED_LEVELS.get(record.levelname, record.levelname)
+        return self._style._fmt % {**record.__dict__, "levelname": levelname}
 
 
 def setup_logger(name: str = "cerina", level: Optional[str] = None) -> logging.Logger:
@@ -128,6 +123,39 @@ def setup_logger(name: str = "cerina", level: Optional[str] = None) -> logging.L
 logger = setup_logger()
 
 
+class BoundLogger(logging.LoggerAdapter):
+    """
+    Logger adapter carrying bound context (structlog-style ``bind``).
+
+    The context is attached to every record as ``extra`` fields (picked up by
+    the JSON formatter) and rendered as a ``key=value`` suffix for the
+    human-readable formatters. Formatting only happens for enabled levels.
+    """
+
+    def process(self, msg, kwargs):
+        """Attach bound context to the record."""
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        context = " ".join(f"{key}={value}" for key, value in self.extra.items())
+        return (f"{msg} | {context}" if context else msg), kwargs
+
+    def bind(self, **context) -> "BoundLogger":
+        """Return a child logger with additional bound context."""
+        return BoundLogger(self.logger, {**self.extra, **context})
+
+
+def bind_logger(**context) -> BoundLogger:
+    """
+    Get a logger with context bound once for a unit of work.
+
+    Args:
+        **context: Key/value pairs attached to every record
+
+    Returns:
+        BoundLogger wrapping the global logger
+    """
+    return BoundLogger(logger, context)
+
+
 # Convenience functions
 
 def log_exception(exc: Exception, context: Optional[str] = None):
@@ -154,8 +182,11 @@ def log_api_request(method: str, path: str, status_code: int, duration: float):
         status_code: Response status code
         duration: Request duration in seconds
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info(
-        f"API Request",
+        "API Request",
         extra={
             "method": method,
             "path": path,
@@ -174,16 +205,20 @@ def log_agent_activity(agent_name: str, action: str, details: Optional[dict] = N
         action: Action performed
         details: Optional additional details
     """
+    # Skip building the payload when INFO is filtered out. Wall-clock time
+    # comes from the record itself (%(asctime)s)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_data = {
         "agent": agent_name,
-        "action": action,
-        "timestamp": datetime.now().isoformat()
+        "action": action
     }
     
     if details:
         log_data.update(details)
     
-    logger.info(f"[{agent_name}] {action}", extra=log_data)
+    logger.info("[%s] %s", agent_name, action, extra=log_data)
 
 
 def log_workflow_event(thread_id: str, event_type: str, details: Optional[dict] = None):
@@ -195,16 +230,18 @@ def log_workflow_event(thread_id: str, event_type: str, details: Optional[dict]
         event_type: Type of event
         details: Optional additional details
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_data = {
         "thread_id": thread_id,
-        "event_type": event_type,
-        "timestamp": datetime.now().isoformat()
+        "event_type": event_type
     }
     
     if details:
         log_data.update(details)
     
-    logger.info(f"Workflow [{thread_id}]: {event_type}", extra=log_data)
+    logger.info("Workflow [%s]: %s", thread_id, event_type, extra=log_data)
 
 
 # Context manager for logging blocks
@@ -226,14 +263,14 @@ class LogBlock:
     
     def __enter__(self):
         """Enter the context."""
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         log_method = getattr(logger, self.level.lower(), logger.info)
         log_method(f"Starting: {self.operation}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the context."""
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self.start_time
         
         if exc_type is None:
             log_method = getattr(logger, self.level.lower(), logger.info)
@@ -263,15 +300,15 @@ def log_performance(operation_name: Optional[str] = None):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             op_name = operation_name or func.__name__
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             try:
                 result = func(*args, **kwargs)
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 logger.debug(f"Performance: {op_name} completed in {duration:.3f}s")
                 return result
             except Exception as e:
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 logger.error(f"Performance: {op_name} failed after {duration:.3f}s - {str(e)}")
                 raise
         
@@ -2,10 +2,12 @@
 Validation utilities for input data.
 """
 
-import re
+from functools import lru_cache
 from typing import Tuple, Optional
 from urllib.parse import urlparse
 
+from ._patterns import EMAIL_RE, HARMFUL_RE, SIMPLE_HTTP_URL_RE, UUID4_RE
+
 
 def validate_user_intent(user_intent: str) -> Tuple[bool, Optional[str]]:
     """
@@ -28,18 +30,9 @@ def validate_user_intent(user_intent: str) -> Tuple[bool, Optional[str]]:
     if len(user_intent) > 2000:
         return False, "User intent must be less than 2000 characters"
     
-    # Check for potentially harmful content
-    harmful_patterns = [
-        r'<script',
-        r'javascript:',
-        r'onerror=',
-        r'onclick=',
-    ]
-    
-    user_intent_lower = user_intent.lower()
-    for pattern in harmful_patterns:
-        if re.search(pattern, user_intent_lower):
-            return False, "User intent contains potentially harmful content"
+    # Check for potentially harmful content (one case-insensitive pass)
+    if HARMFUL_RE.search(user_intent):
+        return False, "User intent contains potentially harmful content"
     
     return True, None
 
@@ -78,15 +71,10 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format
     """
-    if not email:
+    if not email or not isinstance(email, str):
         return False
     
-    # Simple email regex
-    email_pattern = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    )
-    
-    return bool(email_pattern.match(email))
+    return bool(EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -102,6 +90,10 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
     
+    # Fast path: one anchored match for the common case, no ParseResult
+    if isinstance(url, str) and SIMPLE_HTTP_URL_RE.match(url):
+        return True
+    
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
@@ -109,6 +101,7 @@ def validate_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def validate_thread_id_format(thread_id: str) -> Tuple[bool, Optional[str]]:
     """
     Validate thread ID format with detailed error message.
@@ -123,12 +116,7 @@ def validate_thread_id_format(thread_id: str) -> Tuple[bool, Optional[str]]:
         return False, "Thread ID cannot be empty"
     
     # Check UUID4 format
-    uuid_pattern = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-        re.IGNORECASE
-    )
-    
-    if not uuid_pattern.match(thread_id):
+    if not UUID4_RE.match(thread_id):
         return False, "Thread ID must be a valid UUID4"
     
     return True, None